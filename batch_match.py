@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Match many applicant profiles against the job corpus in a single pass.
+
+All profiles' skills, preferred titles and locations are compiled into one
+shared TermMatcher. Each posting is scanned once and every term hit is
+fanned out to the profiles that asked for it, so cost grows with the corpus
+plus the number of matches rather than profiles x corpus.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+from feature_cache import FeatureCache
+from job_record import save_jobs
+from ranking import (
+    ANY_LOCATION_WEIGHT, DESC_SKILL_WEIGHT, LOCATION_WEIGHT, TAG_SKILL_WEIGHT,
+    TITLE_SKILL_WEIGHT, TITLE_WEIGHT, Match, MatchCriteria, published_ts, top_k,
+)
+
+PROFILES_DIR = "config/profiles"
+DEFAULT_PROFILE = "config/user_profile.json"
+
+
+class TermMatcher:
+    """Find which of many substrings occur in a text with one regex scan"""
+
+    def __init__(self, terms):
+        self.terms = sorted({t for t in terms if t}, key=len, reverse=True)
+        if self.terms:
+            # The lookahead reports the longest term starting at every position
+            alternation = "|".join(re.escape(t) for t in self.terms)
+            self.pattern = re.compile(f"(?=({alternation}))")
+        else:
+            self.pattern = None
+        # A hit on a longer term implies every term it contains
+        self.implied = {t: [u for u in self.terms if u in t] for t in self.terms}
+
+    def find(self, text):
+        if not self.pattern or not text:
+            return set()
+        found = set()
+        for longest in {m.group(1) for m in self.pattern.finditer(text)}:
+            found.update(self.implied[longest])
+        return found
+
+
+def load_profiles(source=None):
+    """Load profiles from a directory of JSON files, a single file or the default profile"""
+    if source is None:
+        source = PROFILES_DIR if os.path.isdir(PROFILES_DIR) else DEFAULT_PROFILE
+    paths = sorted(glob.glob(os.path.join(source, "*.json"))) if os.path.isdir(source) else [source]
+
+    profiles = {}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                profiles[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Skipping profile {path}: {e}")
+    print(f"👥 Loaded {len(profiles)} profiles from {source}")
+    return profiles
+
+
+class BatchMatcher:
+    """Shared matcher compiled from every profile's criteria"""
+
+    def __init__(self, profiles):
+        self.names = list(profiles)
+        self.criteria = [MatchCriteria.from_profile(profiles[name]) for name in self.names]
+
+        # term -> indices of the profiles that care about it
+        self.by_title = defaultdict(list)
+        self.by_skill = defaultdict(list)
+        self.by_location = defaultdict(list)
+        self.any_location = []
+        for idx, criteria in enumerate(self.criteria):
+            for title in set(criteria.titles):
+                self.by_title[title].append(idx)
+            for skill in set(criteria.skills):
+                self.by_skill[skill].append(idx)
+            if criteria.location:
+                self.by_location[criteria.location].append(idx)
+            else:
+                self.any_location.append(idx)
+        self.any_location_set = set(self.any_location)
+
+        self.title_matcher = TermMatcher(list(self.by_title) + list(self.by_skill))
+        self.skill_matcher = TermMatcher(self.by_skill)
+        self.location_matcher = TermMatcher(self.by_location)
+
+    def score(self, job, features):
+        """Scan one posting once and return {profile index: (score, reasons)}"""
+        hits = defaultdict(lambda: [0, []])
+
+        title_terms = self.title_matcher.find(features["title"])
+        for flag_terms, index, weight, label in (
+            (title_terms, self.by_title, TITLE_WEIGHT, "title matches '{}'"),
+            (title_terms, self.by_skill, TITLE_SKILL_WEIGHT, "skill '{}' in title"),
+            (set(features["tags"]), self.by_skill, TAG_SKILL_WEIGHT, "tagged '{}'"),
+        ):
+            seen = set()
+            for term in flag_terms:
+                for idx in index.get(term, ()):
+                    if idx not in seen:
+                        seen.add(idx)
+                        hits[idx][0] += weight
+                        hits[idx][1].append(label.format(term))
+
+        desc_terms = defaultdict(list)
+        for term in self.skill_matcher.find(features["text"]):
+            for idx in self.by_skill[term]:
+                desc_terms[idx].append(term)
+        for idx, terms in desc_terms.items():
+            hits[idx][0] += DESC_SKILL_WEIGHT
+            hits[idx][1].append(f"description mentions {', '.join(sorted(terms)[:5])}")
+
+        seen = set()
+        for term in self.location_matcher.find(job.location.lower()):
+            for idx in self.by_location[term]:
+                if idx not in seen:
+                    seen.add(idx)
+                    hits[idx][0] += LOCATION_WEIGHT
+                    hits[idx][1].append(f"location matches '{term}'")
+
+        # "No location preference" only adds to jobs that matched something,
+        # otherwise every posting would fan out to those profiles
+        for idx in self.any_location_set.intersection(hits):
+            hits[idx][0] += ANY_LOCATION_WEIGHT
+            hits[idx][1].append("no location preference")
+        return hits
+
+    def match(self, jobs, k, cache=None):
+        """Return {profile name: top-k Matches} after a single corpus pass"""
+        own_cache = cache is None
+        if own_cache:
+            cache = FeatureCache()
+
+        scored = defaultdict(list)
+        for seq, job in enumerate(jobs):
+            features = cache.get(job)
+            hits = self.score(job, features)
+            if not hits:
+                continue
+            recency = published_ts(job.published)
+            for idx, (score, reasons) in hits.items():
+                scored[idx].append(((score, recency, -seq), Match(job, score, reasons)))
+
+        if own_cache:
+            cache.save()
+        return {name: top_k(scored.get(idx, ()), k) for idx, name in enumerate(self.names)}
+
+
+def match_profiles(profiles, jobs, k=10, cache=None):
+    """Match every profile against jobs in one pass and report timing"""
+    start = time.perf_counter()
+    matcher = BatchMatcher(profiles)
+    compiled = time.perf_counter()
+    results = matcher.match(jobs, k, cache)
+    done = time.perf_counter()
+
+    print(f"⏱️ Compiled {len(profiles)} profiles in {(compiled - start) * 1000:.1f} ms, "
+          f"matched {len(jobs)} jobs in {(done - compiled) * 1000:.1f} ms")
+    for name, matches in results.items():
+        best = f", best score {matches[0].score}" if matches else ""
+        print(f"   {name}: {len(matches)} matches{best}")
+    return results
+
+
+def main():
+    from match_jobs import CORPUS_PATH, load_snapshot
+
+    parser = argparse.ArgumentParser(description="Match many profiles against the job store in one pass")
+    parser.add_argument("profiles", nargs="?", help=f"profile directory or file (default: {PROFILES_DIR})")
+    parser.add_argument("--top", type=int, default=10, help="matches to keep per profile")
+    parser.add_argument("--jobs", default=CORPUS_PATH, help="job store to match against (unfiltered corpus)")
+    parser.add_argument("--out", default="output/matches", help="directory for per-profile results")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.profiles)
+    jobs, _ = load_snapshot(args.jobs)
+    if not profiles or not jobs:
+        print("❌ Need at least one profile and one job")
+        return
+
+    results = match_profiles(profiles, jobs, args.top)
+
+    os.makedirs(args.out, exist_ok=True)
+    for name, matches in results.items():
+        save_jobs(os.path.join(args.out, f"{name}.json"), matches)
+    print(f"💾 Wrote per-profile matches to {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ import os
 import requests
 import feedparser
 
+try:
+    from job_snapshot import open_snapshot
+except ImportError:  # numpy not installed: fall back to parsing the JSON
+    open_snapshot = None
+
 def check_files():
     """Check if required files exist"""
     print("📁 Checking file structure...")
@@ -32,6 +37,9 @@ def check_files():
     output_files = ["jobs.json", "safe_jobs.json"]
     for file_path in output_files:
         if os.path.exists(file_path):
+            if open_snapshot is not None:
+                check_snapshot(file_path)
+                continue
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
@@ -43,6 +51,25 @@ def check_files():
         else:
             print(f"📄 {file_path} - Not found")
 
+def check_snapshot(file_path):
+    """Summarize a job file from its memory-mapped columnar snapshot"""
+    try:
+        snap = open_snapshot(file_path)
+    except Exception as e:
+        print(f"❌ {file_path} - Could not build snapshot: {e}")
+        return
+    print(f"📄 {file_path} - Found ({snap.count} jobs)")
+    if snap.count:
+        print(f"   Sample: {snap.title(0) or 'No title'} @ {snap.company(0) or 'No company'}")
+        by_source = ", ".join(f"{name or 'unknown'} {count}" for name, count in snap.counts_by("source"))
+        print(f"   Per source: {by_source}")
+        top_tags = snap.top_terms("tag", n=5)
+        if top_tags:
+            print("   Top tags: " + ", ".join(f"{tag} ({count})" for tag, count in top_tags))
+        top_skills = snap.top_terms("skill", n=5, since_days=7)
+        if top_skills:
+            print("   Top profile skills this week: " + ", ".join(f"{skill} ({count})" for skill, count in top_skills))
+
 def test_wwr_rss():
     """Test We Work Remotely RSS feed"""
     print("\n🔍 Testing WeWorkRemotely RSS...")
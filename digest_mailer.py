@@ -0,0 +1,189 @@
+"""
+Batched, pooled delivery of job-suggestion digests over SMTP.
+
+Credentials come from the environment (SMTP_USER / SMTP_PASS, as passed by
+the workflow). A small pool of worker threads each keeps one authenticated
+connection open and sends a batch of messages through it before
+reconnecting, so N digests cost a handful of TLS handshakes instead of N.
+
+For local testing point SMTP_HOST/SMTP_PORT at an aiosmtpd-style server and
+set SMTP_STARTTLS=0; login is skipped when SMTP_PASS is empty.
+"""
+import os
+import queue
+import smtplib
+import threading
+import time
+from email.mime.text import MIMEText
+
+DEFAULT_HOST = "smtp-relay.brevo.com"
+DEFAULT_PORT = 587
+SUBJECT = "AutoapplyAI Daily Jobs"
+
+
+def is_retryable(error):
+    """
+    True for failures a reconnect may fix: dropped connections, socket errors
+    and timeouts, and 4xx replies. 5xx replies, refused senders/recipients
+    and other SMTP errors are permanent.
+    """
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # SMTPException subclasses OSError; anything else here is a socket error
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class SMTPConfig:
+    """SMTP settings read from the environment"""
+
+    __slots__ = ("host", "port", "user", "password", "sender", "starttls", "timeout")
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, user="", password="",
+                 sender="", starttls=True, timeout=30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.sender = sender or user
+        self.starttls = starttls
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls, environ=None):
+        env = os.environ if environ is None else environ
+        return cls(
+            host=env.get("SMTP_HOST", DEFAULT_HOST),
+            port=int(env.get("SMTP_PORT", DEFAULT_PORT)),
+            user=env.get("SMTP_USER", ""),
+            password=env.get("SMTP_PASS", ""),
+            sender=env.get("SMTP_FROM", ""),
+            starttls=env.get("SMTP_STARTTLS", "1").lower() not in ("0", "false", "no"),
+        )
+
+
+def render_digest(matches):
+    """Render the plain-text digest body for one recipient's matches"""
+    if not matches:
+        return "No matches found today. Check your profile or try again later."
+    lines = ["Your Daily AutoapplyAI Job Suggestions", ""]
+    for job in matches:
+        lines.append(f"• {job.title} @ {job.company}")
+        lines.append(f"    → {job.url}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_message(sender, recipient, body, subject=SUBJECT):
+    msg = MIMEText(body)
+    msg["From"] = sender
+    msg["To"] = recipient
+    msg["Subject"] = subject
+    return msg
+
+
+def render_digests(results, recipients, sender, subject=SUBJECT):
+    """Turn {name: matches} plus {name: email} into messages in one pass"""
+    messages = []
+    for name, matches in results.items():
+        recipient = recipients.get(name)
+        if recipient:
+            messages.append(build_message(sender, recipient, render_digest(matches), subject))
+    return messages
+
+
+class _Connection:
+    """One lazily opened, authenticated SMTP session"""
+
+    def __init__(self, config):
+        self.config = config
+        self.server = None
+        self.sent = 0
+
+    def open(self):
+        cfg = self.config
+        server = smtplib.SMTP(cfg.host, cfg.port, timeout=cfg.timeout)
+        try:
+            if cfg.starttls:
+                server.starttls()
+            if cfg.user and cfg.password:
+                server.login(cfg.user, cfg.password)
+        except BaseException:
+            server.close()
+            raise
+        self.server = server
+        self.sent = 0
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except Exception:
+                pass
+        self.server = None
+
+    def send(self, msg, batch_size):
+        if self.server is None or self.sent >= batch_size:
+            self.close()
+            self.open()
+        self.server.send_message(msg)
+        self.sent += 1
+
+
+def send_digests(messages, config=None, concurrency=4, batch_size=50, retries=3, backoff=1.0):
+    """
+    Deliver messages over at most ``concurrency`` reused connections.
+    Each connection sends up to ``batch_size`` messages before reconnecting;
+    transient failures reconnect and retry with exponential backoff.
+    Returns (sent, failed) where failed is a list of (message, error).
+    """
+    config = config or SMTPConfig.from_env()
+    pending = queue.Queue()
+    for msg in messages:
+        pending.put(msg)
+
+    lock = threading.Lock()
+    sent = []
+    failed = []
+
+    def worker():
+        conn = _Connection(config)
+        try:
+            while True:
+                try:
+                    msg = pending.get_nowait()
+                except queue.Empty:
+                    return
+                for attempt in range(retries + 1):
+                    try:
+                        conn.send(msg, batch_size)
+                        with lock:
+                            sent.append(msg)
+                        break
+                    except OSError as e:
+                        retryable = is_retryable(e)
+                        if retryable:
+                            conn.close()
+                        if not retryable or attempt == retries:
+                            with lock:
+                                failed.append((msg, e))
+                            break
+                        time.sleep(backoff * 2 ** attempt)
+        finally:
+            conn.close()
+
+    workers = [threading.Thread(target=worker, daemon=True)
+               for _ in range(max(1, min(concurrency, len(messages))))]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    print(f"📬 Delivered {len(sent)}/{len(messages)} digests via {config.host} "
+          f"over {len(workers)} connection(s)")
+    for msg, e in failed:
+        print(f"❌ Failed to send to {msg['To']}: {e}")
+    return sent, failed
@@ -0,0 +1,268 @@
+"""
+Per-job feature cache keyed by a content hash of (description, title, tags).
+
+Derived data that every stage needs -- normalized text, tokens, matched
+skills, scam score and the cover-letter snippet -- is computed once per
+unique posting and persisted, so repeat runs only pay for new content.
+
+Several processes share the file (the feed daemon, cron runs, generators),
+so save() holds an advisory lock and folds in entries other processes
+saved since this one last read it before replacing the file.
+"""
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+from collections import Counter, OrderedDict
+
+from html_text import html_to_text
+from scam_filter import scam_score
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized across processes
+    fcntl = None
+
+# Bump whenever compute_features() changes shape or semantics; older cache
+# files are discarded wholesale on load.
+FEATURE_CACHE_VERSION = 5
+FEATURE_CACHE_PATH = ".cache/job_features.json.gz"
+MAX_ENTRIES = 50000
+MAX_SKILL_SETS = 8      # matched-skill results kept per entry, one per skill list
+SNIPPET_LENGTH = 120
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+WHITESPACE_RE = re.compile(r"\s+")
+# scikit-learn CountVectorizer's default token_pattern
+VECTOR_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
+def job_key(job):
+    """Content hash of the fields features are derived from"""
+    tags = job.get("tags") or []
+    payload = "\x1f".join([
+        job.get("description", "") or "",
+        job.get("title", "") or "",
+        "\x1e".join(t for t in tags if isinstance(t, str)),
+    ])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def skills_key(skills):
+    """Stable fingerprint of a skill list, used to validate matched skills"""
+    joined = "\x1f".join(sorted(s.lower().strip() for s in skills))
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:12]
+
+
+def normalize_text(text):
+    """Lowercase and collapse whitespace"""
+    return WHITESPACE_RE.sub(" ", text or "").strip().lower()
+
+
+def tokenize(text):
+    """Split normalized text into word tokens (keeps c++, c#, react.js)"""
+    return [t.rstrip(".-") for t in TOKEN_RE.findall(text)]
+
+
+def match_skills(skills, text):
+    """Return the skills that occur in the description text"""
+    return [s for s in skills if s in text]
+
+
+def matched_skill_tokens(token_counts, skills):
+    """Tokens that are exactly one of skills, repeated as often as they occur"""
+    skill_set = {skill.lower() for skill in skills}
+    matched = []
+    for token, count in token_counts.items():
+        if token in skill_set:
+            matched.extend([token] * count)
+    return matched
+
+
+def skill_similarity(job_skills, applicant_skills):
+    """
+    Cosine similarity of term counts, computed as CountVectorizer fitted on
+    the job side plus cosine_similarity would: the 0.75 threshold in
+    config.yaml was tuned against that measure.
+    """
+    job = Counter(VECTOR_TOKEN_RE.findall(" ".join(job_skills).lower()))
+    applicant = Counter(t for t in VECTOR_TOKEN_RE.findall(" ".join(applicant_skills).lower())
+                        if t in job)
+    dot = sum(count * applicant[t] for t, count in job.items())
+    if not dot:
+        return 0.0
+    return dot / math.sqrt(sum(c * c for c in job.values()) * sum(c * c for c in applicant.values()))
+
+
+def compute_features(job, skills=None):
+    """Compute every cached feature for a single job"""
+    # Features are derived from the sanitized text, never the raw HTML
+    raw = job.get("description", "") or ""
+    plain = job.get("text")
+    if plain is None:
+        plain = html_to_text(raw)
+    title = normalize_text(job.get("title", ""))
+    text = normalize_text(plain)
+    tags = [t.lower() for t in job.get("tags") or [] if isinstance(t, str)]
+    snippet = plain if len(plain) < SNIPPET_LENGTH else plain[:SNIPPET_LENGTH] + "..."
+    features = {
+        "title": title,
+        "text": text,
+        "tags": tags,
+        # token -> count in first-seen order; counts feed similarity scoring
+        "tokens": dict(Counter(tokenize(text))),
+        "skill_matches": {},
+        "scam": scam_score(text, raw),
+        "snippet": snippet,
+    }
+    if skills is not None:
+        select_skills(features, skills)
+    return features
+
+
+def select_skills(features, skills):
+    """
+    Point features["skills"] at the matches for this skill list, computing
+    them only if the list has not been seen for this entry. Returns True if
+    a new result was stored.
+    """
+    matches = features["skill_matches"]
+    fingerprint = skills_key(skills)
+    matched = matches.get(fingerprint)
+    added = matched is None
+    if added:
+        matched = match_skills([s.lower().strip() for s in skills], features["text"])
+        if len(matches) >= MAX_SKILL_SETS:
+            del matches[next(iter(matches))]
+        matches[fingerprint] = matched
+    features["skills"] = matched
+    return added
+
+
+class FeatureCache:
+    """Size-bounded LRU of job features persisted as compact gzipped JSON"""
+
+    def __init__(self, path=FEATURE_CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self.disk_version = None
+        self.load()
+
+    def _file_version(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read(self):
+        """Return the entries on disk, or None if the file is another version"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FEATURE_CACHE_VERSION:
+            return None
+        return OrderedDict(data.get("entries", []))
+
+    def load(self):
+        """Load the cache file, discarding it on version mismatch"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        version = self._file_version()
+        try:
+            entries = self._read()
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable feature cache {self.path}: {e}")
+            return
+        if entries is None:
+            print("♻️ Feature cache version changed, rebuilding")
+            self.dirty = True
+            return
+        self.entries = entries
+        self.disk_version = version
+
+    def get(self, job, skills=None):
+        """
+        Return cached features for a job, computing them on a miss.
+        features["skills"] holds the matches for skills; when skills is None
+        it is left as it was and no skill matching happens.
+        """
+        key = job_key(job)
+        features = self.entries.get(key)
+        if features is None:
+            self.misses += 1
+            features = compute_features(job, skills)
+            self.entries[key] = features
+            self.dirty = True
+            self.evict()
+            return features
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        # Same posting, new skill list: only the skill match needs computing
+        if skills is not None and select_skills(features, skills):
+            self.dirty = True
+        return features
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries"""
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def merge_disk(self):
+        """Fold in entries another process saved since this one read the file"""
+        version = self._file_version()
+        if version is None or version == self.disk_version:
+            return
+        try:
+            disk = self._read()
+        except Exception:
+            return
+        if not disk:
+            return
+        for key, features in self.entries.items():
+            theirs = disk.get(key)
+            if theirs is not None:
+                matches = {**theirs["skill_matches"], **features["skill_matches"]}
+                while len(matches) > MAX_SKILL_SETS:
+                    del matches[next(iter(matches))]
+                features["skill_matches"] = matches
+            # Ours were used most recently, so they go to the LRU tail
+            disk[key] = features
+            disk.move_to_end(key)
+        self.entries = disk
+        self.evict()
+
+    def save(self):
+        """Merge with the file on disk and atomically replace it, if changed"""
+        if not self.path or not self.dirty:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self.merge_disk()
+            payload = {"version": FEATURE_CACHE_VERSION, "entries": list(self.entries.items())}
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self.disk_version = self._file_version()
+        self.dirty = False
+
+    def stats(self):
+        return f"{self.hits} hits, {self.misses} misses, {len(self.entries)} entries"
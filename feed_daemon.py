@@ -0,0 +1,176 @@
+"""
+Long-running incremental feed poller (``python find_jobs.py --daemon``).
+
+Each source is polled on its own adaptive interval: it shortens while a
+feed keeps producing new postings and backs off while it is quiet. A
+per-source cursor (newest ``published`` timestamp plus a bounded window of
+recent URLs) is persisted so only entries not seen before are processed,
+and those are sanitized into the unfiltered corpus, then go through the
+scam filter and profile filtering into jobs.json / safe_jobs.json.
+"""
+import heapq
+import json
+import os
+import signal
+import threading
+import time
+from collections import deque
+
+from feature_cache import FeatureCache
+from html_text import sanitize_jobs
+from job_record import load_jobs, save_jobs
+from match_jobs import CORPUS_PATH
+from ranking import published_ts
+from scam_filter import is_scam
+
+CURSOR_PATH = ".cache/feed_cursors.json"
+MIN_INTERVAL = 120
+MAX_INTERVAL = 3600
+DEFAULT_INTERVAL = 600
+RECENT_URLS = 2000
+MAX_STORE = 5000
+
+
+class SourceState:
+    """Polling interval and cursor for one source"""
+
+    __slots__ = ("name", "fetch", "interval", "newest", "recent", "recent_set")
+
+    def __init__(self, name, fetch, interval=DEFAULT_INTERVAL, newest=0.0, recent=()):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.newest = newest
+        self.recent = deque(recent, maxlen=RECENT_URLS)
+        self.recent_set = set(self.recent)
+
+    def select_new(self, jobs):
+        """Return jobs past the cursor without moving it"""
+        fresh = []
+        seen = set()
+        for job in jobs:
+            ts = published_ts(job.published)
+            if job.url in self.recent_set or job.url in seen or (ts and ts < self.newest):
+                continue
+            seen.add(job.url)
+            fresh.append(job)
+        return fresh
+
+    def advance(self, jobs):
+        """Move the cursor past jobs once they have been processed"""
+        for job in jobs:
+            self.newest = max(self.newest, published_ts(job.published))
+            if len(self.recent) == self.recent.maxlen:
+                self.recent_set.discard(self.recent[0])
+            self.recent.append(job.url)
+            self.recent_set.add(job.url)
+
+    def adapt(self, found):
+        """Halve the interval after new postings, back off by 1.5x when idle"""
+        if found:
+            self.interval = max(MIN_INTERVAL, self.interval / 2)
+        else:
+            self.interval = min(MAX_INTERVAL, self.interval * 1.5)
+
+    def to_dict(self):
+        return {"interval": self.interval, "newest": self.newest, "recent": list(self.recent)}
+
+
+def load_cursors(path=CURSOR_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cursors(states, path=CURSOR_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({s.name: s.to_dict() for s in states}, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def merge_into(path, new_jobs, limit=MAX_STORE):
+    """Prepend new jobs to a JSON job store, deduplicated by URL and capped"""
+    try:
+        existing = load_jobs(path)
+    except (OSError, ValueError):
+        existing = []
+    seen = {job.url for job in new_jobs}
+    merged = list(new_jobs) + [job for job in existing if job.url not in seen]
+    save_jobs(path, merged[:limit])
+
+
+def process_new_jobs(new_jobs, cache):
+    """Run freshly polled jobs through the downstream stages"""
+    from find_jobs import filter_jobs_by_profile
+
+    sanitize_jobs(new_jobs)
+    merge_into(CORPUS_PATH, new_jobs)
+    safe = [job for job in new_jobs
+            if not is_scam(job.text, job.url, score=cache.get(job)["scam"])]
+    relevant = filter_jobs_by_profile(safe, cache)
+    if relevant:
+        merge_into("jobs.json", relevant)
+        merge_into("safe_jobs.json", relevant)
+    cache.save()
+    print(f"🆕 {len(new_jobs)} new, {len(new_jobs) - len(safe)} flagged as scams, "
+          f"{len(relevant)} added to jobs.json")
+    return relevant
+
+
+def run_daemon(sources, cursor_path=CURSOR_PATH):
+    """Poll sources until SIGINT/SIGTERM; sources maps name -> fetch callable"""
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        print(f"\n🛑 Received signal {signum}, shutting down after the current poll...")
+        stop.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    saved = load_cursors(cursor_path)
+    states = []
+    for name, fetch in sources.items():
+        cursor = saved.get(name, {})
+        states.append(SourceState(name, fetch, cursor.get("interval", DEFAULT_INTERVAL),
+                                  cursor.get("newest", 0.0), cursor.get("recent", ())))
+
+    cache = FeatureCache()
+    # (due time, tie-break, state): always wake for the source due soonest
+    schedule = [(time.monotonic(), i, state) for i, state in enumerate(states)]
+    heapq.heapify(schedule)
+    print(f"👀 Polling {', '.join(sources)} (Ctrl+C to stop)")
+
+    while not stop.is_set():
+        due, i, state = schedule[0]
+        if stop.wait(max(0.0, due - time.monotonic())):
+            break
+        heapq.heappop(schedule)
+
+        try:
+            fresh = state.select_new(state.fetch())
+        except Exception as e:
+            print(f"⚠️ Polling {state.name} failed: {e}")
+            fresh = []
+        if fresh:
+            # Only advance the cursor once the jobs are stored, so a failed
+            # save is retried on the next poll instead of losing them
+            try:
+                process_new_jobs(fresh, cache)
+                state.advance(fresh)
+            except Exception as e:
+                print(f"⚠️ Processing {len(fresh)} new {state.name} jobs failed, will retry: {e}")
+                fresh = []
+        state.adapt(bool(fresh))
+        save_cursors(states, cursor_path)
+
+        print(f"⏳ {state.name}: next poll in {state.interval / 60:.1f} min")
+        heapq.heappush(schedule, (time.monotonic() + state.interval, i, state))
+
+    save_cursors(states, cursor_path)
+    cache.save()
+    print("👋 Feed daemon stopped")
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
+import argparse
 import json
 import feedparser
-import requests
-import time
 from datetime import datetime
+from feature_cache import FeatureCache
+from job_record import Job, save_jobs
+from html_text import sanitize_jobs
+from rate_limiter import limited_get
+from match_jobs import CORPUS_PATH
 
 def scrape_wwr_rss():
     """Scrape We Work Remotely RSS feed"""
     url = "https://weworkremotely.com/categories/remote-programming-jobs.rss"
     try:
         print("Fetching WWR RSS feed...")
-        feed = feedparser.parse(url)
+        response = limited_get(url, headers={"User-Agent": "AutoapplyAI/1.0"}, timeout=15)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
         jobs = []
         
         if not feed.entries:
@@ -27,15 +33,15 @@ def scrape_wwr_rss():
                 company = "Unknown Company"
                 job_title = entry.title.strip()
             
-            jobs.append({
-                "title": job_title,
-                "company": company,
-                "url": entry.link,
-                "description": getattr(entry, 'summary', ''),
-                "published": getattr(entry, 'published', ''),
-                "location": "Remote",
-                "source": "WeWorkRemotely"
-            })
+            jobs.append(Job(
+                title=job_title,
+                company=company,
+                url=entry.link,
+                description=getattr(entry, 'summary', ''),
+                published=getattr(entry, 'published', ''),
+                location="Remote",
+                source="WeWorkRemotely"
+            ))
         
         print(f"✅ Found {len(jobs)} jobs from WWR RSS")
         return jobs
@@ -52,7 +58,7 @@ def scrape_remoteok_api():
     
     try:
         print("Fetching RemoteOK API...")
-        response = requests.get(url, headers=headers, timeout=10)
+        response = limited_get(url, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -67,15 +73,16 @@ def scrape_remoteok_api():
             if not isinstance(job_data, dict):
                 continue
                 
-            jobs.append({
-                "title": job_data.get("position", "Unknown Position"),
-                "company": job_data.get("company", "Unknown Company"),
-                "url": f"https://remoteok.com/remote-jobs/{job_data.get('id', '')}",
-                "description": job_data.get("description", ""),
-                "location": job_data.get("location", "Remote"),
-                "tags": job_data.get("tags", []),
-                "source": "RemoteOK"
-            })
+            jobs.append(Job(
+                title=job_data.get("position", "Unknown Position"),
+                company=job_data.get("company", "Unknown Company"),
+                url=f"https://remoteok.com/remote-jobs/{job_data.get('id', '')}",
+                description=job_data.get("description", ""),
+                location=job_data.get("location", "Remote"),
+                published=job_data.get("date", ""),
+                tags=job_data.get("tags", []),
+                source="RemoteOK"
+            ))
         
         print(f"✅ Found {len(jobs)} jobs from RemoteOK")
         return jobs
@@ -92,14 +99,14 @@ def load_fallback_jobs():
         # Convert to expected format
         formatted_jobs = []
         for job in fallback_jobs:
-            formatted_jobs.append({
-                "title": job.get("title", ""),
-                "company": job.get("company", ""),
-                "description": job.get("description", ""),
-                "url": f"mailto:{job.get('email', '')}",  # Convert email to URL format
-                "location": "Various",
-                "source": "Local Config"
-            })
+            formatted_jobs.append(Job(
+                title=job.get("title", ""),
+                company=job.get("company", ""),
+                description=job.get("description", ""),
+                url=f"mailto:{job.get('email', '')}",  # Convert email to URL format
+                location="Various",
+                source="Local Config"
+            ))
         
         print(f"✅ Loaded {len(formatted_jobs)} fallback jobs from config")
         return formatted_jobs
@@ -107,7 +114,7 @@ def load_fallback_jobs():
         print(f"⚠️ Failed to load fallback jobs: {e}")
         return []
 
-def filter_jobs_by_profile(jobs):
+def filter_jobs_by_profile(jobs, cache=None):
     """Filter jobs based on user profile"""
     try:
         with open("config/user_profile.json", "r") as f:
@@ -116,25 +123,36 @@ def filter_jobs_by_profile(jobs):
         user_skills = [skill.lower() for skill in profile.get("skills", [])]
         preferred_titles = [title.lower() for title in profile.get("job_preferences", {}).get("preferred_titles", [])]
         
+        own_cache = cache is None
+        if own_cache:
+            cache = FeatureCache()
+        
         filtered_jobs = []
         for job in jobs:
-            title_lower = job["title"].lower()
-            desc_lower = job["description"].lower()
+            features = cache.get(job, user_skills)
+            title_lower = features["title"]
             
             # Check if job matches user skills or preferred titles
-            skill_match = any(skill in title_lower or skill in desc_lower for skill in user_skills)
+            skill_match = bool(features["skills"]) or any(skill in title_lower for skill in user_skills)
             title_match = any(pref_title in title_lower for pref_title in preferred_titles)
             
             if skill_match or title_match or not user_skills:  # Include all if no skills specified
                 filtered_jobs.append(job)
         
-        print(f"✅ Filtered to {len(filtered_jobs)} relevant jobs")
+        print(f"✅ Filtered to {len(filtered_jobs)} relevant jobs (feature cache: {cache.stats()})")
+        if own_cache:
+            cache.save()
         return filtered_jobs
     except Exception as e:
         print(f"⚠️ Profile filtering failed, keeping all jobs: {e}")
         return jobs
 
-def main():
+def collect_jobs(fallback=True):
+    """
+    Fetch every source, sanitize and deduplicate; returns (all_jobs, unique_jobs).
+    With fallback=False an empty result is returned instead of the demo jobs
+    from config/job_list.json.
+    """
     all_jobs = []
     
     # Try multiple sources
@@ -144,41 +162,57 @@ def main():
     wwr_jobs = scrape_wwr_rss()
     all_jobs.extend(wwr_jobs)
     
-    # Small delay between API calls
-    time.sleep(1)
-    
     # Source 2: RemoteOK API
     remoteok_jobs = scrape_remoteok_api()
     all_jobs.extend(remoteok_jobs)
     
     # If no jobs found, use fallback
-    if not all_jobs:
+    if not all_jobs and fallback:
         print("⚠️ No jobs found from external sources, using fallback...")
         all_jobs = load_fallback_jobs()
     
-    if not all_jobs:
-        print("❌ No jobs found from any source!")
-        return
+    # Convert HTML descriptions to plain text once, at ingest
+    sanitize_jobs(all_jobs)
     
     # Remove duplicates by URL
     seen_urls = set()
     unique_jobs = []
     for job in all_jobs:
-        if job["url"] not in seen_urls:
-            seen_urls.add(job["url"])
+        if job.url not in seen_urls:
+            seen_urls.add(job.url)
             unique_jobs.append(job)
     
+    return all_jobs, unique_jobs
+
+def main():
+    all_jobs, unique_jobs = collect_jobs()
+    
+    if not all_jobs:
+        print("❌ No jobs found from any source!")
+        return
+    
+    # Unfiltered corpus for multi-profile matching (batch_match, digests)
+    save_jobs(CORPUS_PATH, unique_jobs)
+    
     # Filter jobs based on user profile
     filtered_jobs = filter_jobs_by_profile(unique_jobs)
     
     # Save to jobs.json
-    with open("jobs.json", "w") as f:
-        json.dump(filtered_jobs, f, indent=2)
+    save_jobs("jobs.json", filtered_jobs)
     
     print(f"✅ Successfully wrote {len(filtered_jobs)} jobs to jobs.json")
     
+    # Columnar snapshot for debug_jobs / ad-hoc analytics (needs numpy)
+    try:
+        from job_snapshot import export_snapshot
+        export_snapshot("jobs.json")
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"⚠️ Could not export job snapshot: {e}")
+    
     # Also create the simple URL format that some scripts expect
-    simple_urls = [job["url"] for job in filtered_jobs]
+    simple_urls = [job.url for job in filtered_jobs]
     with open("job_urls.json", "w") as f:
         json.dump(simple_urls, f, indent=2)
     
@@ -191,6 +225,21 @@ def main():
     if filtered_jobs:
         print("\n🎯 Sample jobs found:")
         for i, job in enumerate(filtered_jobs[:3], 1):
-            print(f"{i}. {job['title']} at {job['company']} ({job['source']})")
+            print(f"{i}. {job.title} at {job.company} ({job.source})")
+
+def daemon():
+    """Poll every source incrementally until interrupted"""
+    from feed_daemon import run_daemon
+    run_daemon({
+        "WeWorkRemotely": scrape_wwr_rss,
+        "RemoteOK": scrape_remoteok_api,
+    })
+
 if __name__ == "__main__":
-    main()         
+    parser = argparse.ArgumentParser(description="Find remote jobs matching your profile")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and poll sources incrementally")
+    if parser.parse_args().daemon:
+        daemon()
+    else:
+        main()         
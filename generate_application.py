@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
-import os, sys, time, json, yaml
+import os, sys, time, yaml
+from collections import Counter
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -8,9 +9,10 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import CountVectorizer
 from docx import Document
+from feature_cache import FeatureCache, matched_skill_tokens, skill_similarity
+from job_record import load_jobs
+from rate_limiter import CircuitOpenError, get_limiter
 
 def setup_driver():
     opts = uc.ChromeOptions()
@@ -21,18 +23,13 @@ def setup_driver():
     driver = uc.Chrome(options=opts)
     return driver
 
-def extract_skills(job_description, skills):
-    tokens = word_tokenize(job_description.lower())
-    tokens = [t for t in tokens if t not in stopwords.words('english')]
-    job_skills = [t for t in tokens if t in [skill.lower() for skill in skills]]
-    return job_skills
-
-def calculate_similarity(job_skills, applicant_skills):
-    vectorizer = CountVectorizer()
-    job_skills_vector = vectorizer.fit_transform([' '.join(job_skills)])
-    applicant_skills_vector = vectorizer.transform([' '.join(applicant_skills)])
-    similarity = cosine_similarity(job_skills_vector, applicant_skills_vector)
-    return similarity[0][0]
+def extract_skills(job_description, skills, token_counts=None):
+    # Cached token counts (see feature_cache) skip tokenization entirely
+    if token_counts is None:
+        stop_words = set(stopwords.words('english'))
+        token_counts = Counter(t for t in word_tokenize(job_description.lower()) if t not in stop_words)
+    # Keep repeats: skill_similarity compares term counts
+    return matched_skill_tokens(token_counts, skills)
 
 def generate_cover_letter(job_title, company, matching_skills):
     cover_letter = f"Dear Hiring Manager,\n\nI am excited to apply for the {job_title} role at {company}.\n\nWith my skills in {', '.join(matching_skills)}, I believe I would be a great fit for this position.\n\nThank you for considering my application.\n\nSincerely,\n[Your Name]"
@@ -47,9 +44,17 @@ def update_resume(job_skills, resume_template):
     document.save("updated_resume.docx")
 
 def fill_form(driver, url, name, email, resume, cl):
+    limiter = get_limiter()
+    try:
+        limiter.acquire(url)
+    except CircuitOpenError as e:
+        print(f"⏸️  Skipping {url}: {e}\n")
+        return
+
     try:
+        start = time.monotonic()
         driver.get(url)
-        time.sleep(1)
+        limiter.record(url, latency=time.monotonic() - start)
 
         # Find fields by placeholder or label
         fields = {
@@ -81,13 +86,23 @@ def fill_form(driver, url, name, email, resume, cl):
             submit_button = WebDriverWait(driver, 5).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
             )
+            limiter.acquire(url)
+            start = time.monotonic()
             submit_button.click()
-            time.sleep(2)
+            try:
+                # Wait for the form to go away rather than a fixed pause
+                WebDriverWait(driver, 10).until(EC.staleness_of(submit_button))
+            except TimeoutException:
+                pass
+            limiter.record(url, latency=time.monotonic() - start)
             print("✅  Submitted successfully\n")
         except TimeoutException:
             print("❌  Submit button not found")
 
+    except CircuitOpenError as e:
+        print(f"⏸️  Not submitting to {url}: {e}\n")
     except WebDriverException as e:
+        limiter.record(url, error=True)
         msg = str(e).splitlines()[0]
         print(f"❌ Cannot reach {url}: {msg} – skipping\n")
 
@@ -108,23 +123,25 @@ def main():
         print("❌ config.yaml must define applicant_name, applicant_email, skills, and resume_template")
         sys.exit(1)
 
-    jobs = json.load(open(os.path.join(root, "jobs.json")))
+    jobs = load_jobs(os.path.join(root, "jobs.json"))
     if not jobs:
         print("⚠️  No jobs found in jobs.json")
         sys.exit(0)
 
     driver = setup_driver()
+    cache = FeatureCache()
     for job in jobs:
-        url = job["url"]
-        job_description = job.get("description", "")
-        job_skills = extract_skills(job_description, skills)
-        similarity = calculate_similarity(job_skills, [skill.lower() for skill in skills])
+        url = job.url
+        job_description = job.text
+        job_skills = extract_skills(job_description, skills, cache.get(job, skills)["tokens"])
+        similarity = skill_similarity(job_skills, [skill.lower() for skill in skills])
         if similarity >= 0.75:
             print(f"➡️  Applying to {url}")
-            cl = generate_cover_letter(job.get("title", ""), job.get("company", ""), job_skills)
+            cl = generate_cover_letter(job.title, job.company, job_skills)
             update_resume(job_skills, resume_template)
             resume = "updated_resume.docx"
             fill_form(driver, url, name, email, resume, cl)
+    cache.save()
     driver.quit()
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
-import json, os
+import json, sys
+from job_record import load_jobs
+from output_writer import OutputWriter, safe_filename
+from feature_cache import FeatureCache
 
 # 1) load your profile
 with open("config/user_config.json") as f:
     user = json.load(f)
 
 # 2) load the filtered jobs
-with open("safe_jobs.json") as f:
-    jobs = json.load(f)
+jobs = load_jobs("safe_jobs.json")
 
 # 3) plain-text cover-letter template
 CL_TEMPLATE = """Dear {company},
@@ -21,26 +23,27 @@ Best regards,
 {name}
 """
 
-# 4) ensure output folder exists
-os.makedirs("output/cover_letters", exist_ok=True)
+# 4) set up the output writer (--bundle packs every file into one zip)
+bundle = "output/cover_letters.zip" if "--bundle" in sys.argv else None
+writer = OutputWriter("output/cover_letters", bundle=bundle)
+cache = FeatureCache()
 
 # 5) render one cover letter per job
 for job in jobs:
     skills_str = ", ".join(user["skills"])
-    desc = job["description"]
-    snippet = desc if len(desc) < 120 else desc[:120] + "..."
+    snippet = cache.get(job)["snippet"]
     content = CL_TEMPLATE.format(
-        company=job["company"],
-        job_title=job["title"],
+        company=job.company,
+        job_title=job.title,
         skills=skills_str,
         job_description=snippet,
         name=user["name"]
     )
     # safe filename
-    fname = f"output/cover_letters/{job['company']}_{job['title'].replace(' ','_')}_cover_letter.txt"
-    with open(fname, "w") as out:
-        out.write(content)
+    fname = writer.add(safe_filename(job.company, job.title, suffix="cover_letter.txt"), content)
     print(f"Generated cover letter → {fname}")
 
+cache.save()
 
-
+written, unchanged = writer.close()
+print(f"💾 Wrote {written} cover letters, {unchanged} unchanged")
@@ -1,12 +1,13 @@
-import json, os
+import json, sys
+from job_record import load_jobs
+from output_writer import OutputWriter, safe_filename
 
 # 1) load your profile
 with open("config/user_config.json") as f:
     user = json.load(f)
 
 # 2) load the filtered jobs
-with open("safe_jobs.json") as f:
-    jobs = json.load(f)
+jobs = load_jobs("safe_jobs.json")
 
 # 3) plain-text resume template
 RESUME_TEMPLATE = """Name: {name}
@@ -22,8 +23,9 @@ Key Skills:
 {skills}
 """
 
-# 4) ensure output folder exists
-os.makedirs("output/resumes", exist_ok=True)
+# 4) set up the output writer (--bundle packs every file into one zip)
+bundle = "output/resumes.zip" if "--bundle" in sys.argv else None
+writer = OutputWriter("output/resumes", bundle=bundle)
 
 # 5) render one resume per job
 for job in jobs:
@@ -32,14 +34,14 @@ for job in jobs:
         name=user["name"],
         email=user["email"],
         phone=user["phone"],
-        job_title=job["title"],
-        company=job["company"],
+        job_title=job.title,
+        company=job.company,
         experience_summary=user["experience_summary"],
         skills=skills_str
     )
     # safe filename
-    fname = f"output/resumes/{job['company']}_{job['title'].replace(' ','_')}_resume.txt"
-    with open(fname, "w") as out:
-        out.write(content)
+    fname = writer.add(safe_filename(job.company, job.title, suffix="resume.txt"), content)
     print(f"Generated resume → {fname}")
 
+written, unchanged = writer.close()
+print(f"💾 Wrote {written} resumes, {unchanged} unchanged")
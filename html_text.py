@@ -0,0 +1,91 @@
+"""
+HTML -> compact plain text for job descriptions.
+
+RemoteOK and WWR ship descriptions as raw HTML. Converting once at ingest
+means matchers, the scam filter and the generators scan only visible text
+instead of tags, attributes and inline CSS.
+"""
+import re
+from html import unescape
+from html.parser import HTMLParser
+
+# Tags whose content is never visible text
+SKIP_TAGS = {"script", "style", "head", "title", "noscript", "template", "svg"}
+
+# Tags that imply a line break when rendered
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "td", "th", "table", "section",
+    "article", "header", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "hr", "dd", "dt",
+}
+
+MARKUP_RE = re.compile(r"[<&]")
+SPACES_RE = re.compile(r"[ \t\r\f\v\u00a0]+")
+NEWLINES_RE = re.compile(r"\s*\n\s*")
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def collapse_whitespace(text):
+    """Collapse runs of spaces and blank lines, keeping single line breaks"""
+    text = SPACES_RE.sub(" ", text)
+    return NEWLINES_RE.sub("\n", text).strip()
+
+
+def html_to_text(html):
+    """Convert an HTML fragment to compact plain text"""
+    if not html:
+        return ""
+    if not MARKUP_RE.search(html):
+        # Already plain text: skip the parser entirely
+        return collapse_whitespace(html)
+    parser = _TextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+        text = "".join(parser.parts)
+    except Exception:
+        text = unescape(re.sub(r"<[^>]*>", " ", html))
+    return collapse_whitespace(text)
+
+
+def sanitize_jobs(jobs):
+    """Store plain text on every job and report how many bytes it saved"""
+    raw_bytes = 0
+    text_bytes = 0
+    for job in jobs:
+        description = job.description
+        job.text = html_to_text(description)
+        raw_bytes += len(description.encode("utf-8"))
+        text_bytes += len(job.text.encode("utf-8"))
+
+    saved = raw_bytes - text_bytes
+    pct = 100 * saved / raw_bytes if raw_bytes else 0
+    print(f"🧹 Sanitized {len(jobs)} descriptions: {raw_bytes / 1024:.1f} KB → "
+          f"{text_bytes / 1024:.1f} KB (saved {saved / 1024:.1f} KB, {pct:.0f}%)")
+    return raw_bytes, text_bytes
@@ -1,60 +1,80 @@
+import os
 import yaml
 import json
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import CountVectorizer
+import jinja2
 import streamlit as st
+from job_index import JobIndex
 
-# Load config and job data
-with open('config.yaml', 'r') as f:
-    config = yaml.safe_load(f)
-
-with open('jobs.json', 'r') as f:
-    jobs = json.load(f)
-
-# Define a function to extract skills from job descriptions
-def extract_skills(job_description):
-    # Tokenize the job description and remove stopwords
-    tokens = word_tokenize(job_description.lower())
-    tokens = [t for t in tokens if t not in stopwords.words('english')]
-    # Extract skills (e.g., using a predefined list of skills)
-    skills = [t for t in tokens if t in config['skills']]
-    return skills
-
-# Define a function to calculate similarity between job skills and applicant skills
-def calculate_similarity(job_skills, applicant_skills):
-    # Use cosine similarity or Jaccard similarity
-    vectorizer = CountVectorizer()
-    job_skills_vector = vectorizer.fit_transform([' '.join(job_skills)])
-    applicant_skills_vector = vectorizer.transform([' '.join(applicant_skills)])
-    similarity = cosine_similarity(job_skills_vector, applicant_skills_vector)
-    return similarity[0][0]
-
-# Define a function to generate a cover letter
-def generate_cover_letter(job_title, company, matching_skills):
-    # Use a template engine to generate the cover letter
-    template = jinja2.Template('cover_letter_template.html')
-    cover_letter = template.render(job_title=job_title, company=company, matching_skills=matching_skills)
-    return cover_letter
+CONFIG_PATH = 'config.yaml'
+JOBS_PATH = 'jobs.json'
+PROFILE_PATH = 'config/user_profile.json'
+TEMPLATE_PATH = 'template/cover_letter_template.html'
+
+def file_version(path):
+    # Cache key that changes whenever the file is rewritten
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Load config once per file version instead of on every rerun
+@st.cache_data
+def load_config(path, version):
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+@st.cache_data
+def load_profile(path, version):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# One index per skill set, shared across reruns and sessions
+@st.cache_resource
+def get_index(skills):
+    return JobIndex(skills)
+
+@st.cache_resource
+def get_template(path, version):
+    with open(path, 'r', encoding='utf-8') as f:
+        return jinja2.Template(f.read())
+
+# Answers are cached per (skill set, index version, query); a corpus change
+# bumps the version, and each skill set has its own index
+@st.cache_data(max_entries=256)
+def search(_index, skills, index_version, query, threshold):
+    return [
+        {"similarity": similarity, "matching_skills": matched, "job": job.to_dict()}
+        for similarity, matched, job in _index.search(query, min_similarity=threshold)
+    ]
+
+# Generate a cover letter from the HTML template
+def generate_cover_letter(job, profile, matching_skills):
+    template = get_template(TEMPLATE_PATH, file_version(TEMPLATE_PATH))
+    return template.render(job=job, profile=profile, matching_skills=matching_skills)
+
+config = load_config(CONFIG_PATH, file_version(CONFIG_PATH))
+profile = load_profile(PROFILE_PATH, file_version(PROFILE_PATH))
+
+# Incremental: only re-indexes jobs whose content changed since the last rerun
+index = get_index(tuple(config['skills']))
+added, removed = index.refresh(JOBS_PATH)
 
 # Streamlit app
 st.title('Job Application Automator')
+if added or removed:
+    st.caption(f'Index updated: +{added} / -{removed} jobs ({len(index.docs)} indexed)')
 
 # Get user input (e.g., job search query)
 job_search_query = st.text_input('Job Search Query')
 
 # Filter jobs based on similarity score
-filtered_jobs = []
-for job in jobs:
-    job_skills = extract_skills(job['description'])
-    similarity = calculate_similarity(job_skills, config['skills'])
-    if similarity >= 0.75:
-        filtered_jobs.append(job)
-
-# Generate cover letters and apply to jobs
-for job in filtered_jobs:
-    matching_skills = [skill for skill in job['skills'] if skill in config['skills']]
-    cover_letter = generate_cover_letter(job['title'], job['company'], matching_skills)
-    # Apply to job using the script's existing logic
+filtered_jobs = search(index, tuple(index.skills), index.version, job_search_query, config.get('threshold', 0.75))
+st.write(f'{len(filtered_jobs)} matching jobs')
+
+# Generate cover letters for the matches
+for result in filtered_jobs:
+    job = result['job']
+    with st.expander(f"{job['title']} @ {job['company']} ({result['similarity']:.2f})"):
+        st.write(', '.join(result['matching_skills']) or 'No matching skills')
+        st.markdown(f"[View posting]({job['url']})")
+        if st.button('Generate cover letter', key=job['url']):
+            cover_letter = generate_cover_letter(job, profile, result['matching_skills'])
+            st.download_button('Download cover letter', cover_letter, file_name='cover_letter.html', key=f"dl-{job['url']}")
@@ -0,0 +1,103 @@
+"""
+Incrementally maintained inverted index over job tokens.
+
+Backs the job_filter Streamlit app: every job's tokens (from the feature
+cache) are posted once, free-text queries are answered by intersecting
+posting sets, and refreshing after jobs.json changes only indexes postings
+whose content hash is new and drops the ones that disappeared.
+"""
+import os
+import threading
+
+from feature_cache import (FeatureCache, job_key, matched_skill_tokens, normalize_text,
+                           skill_similarity, tokenize)
+from job_record import load_jobs
+
+
+class JobIndex:
+    def __init__(self, skills=(), cache=None):
+        self.skills = sorted({s.lower().strip() for s in skills})
+        self.cache = cache or FeatureCache()
+        self.docs = {}          # content hash -> Job
+        self.doc_tokens = {}    # content hash -> frozenset of tokens
+        self.doc_scores = {}    # content hash -> (similarity, sorted matched skills)
+        self.postings = {}      # token -> set of content hashes
+        self.source_version = None
+        self.version = 0
+        # Shared across Streamlit sessions, so guard mutation
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def doc_key(job):
+        # Content hash plus URL: identical postings at different URLs stay distinct
+        return f"{job_key(job)}:{job.url}"
+
+    def _add(self, key, job):
+        features = self.cache.get(job)
+        tokens = frozenset(features["tokens"]) | frozenset(tokenize(features["title"]))
+        # Same count-based measure generate_application applies its threshold to
+        matched = matched_skill_tokens(features["tokens"], self.skills)
+        self.docs[key] = job
+        self.doc_tokens[key] = tokens
+        self.doc_scores[key] = (skill_similarity(matched, self.skills), sorted(set(matched)))
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(key)
+
+    def _remove(self, key):
+        for token in self.doc_tokens.pop(key, ()):
+            posting = self.postings.get(token)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self.postings[token]
+        self.docs.pop(key, None)
+        self.doc_scores.pop(key, None)
+
+    def update(self, jobs):
+        """Sync the index with jobs, touching only added and removed postings"""
+        current = {self.doc_key(job): job for job in jobs}
+        with self.lock:
+            removed = [key for key in self.docs if key not in current]
+            added = [key for key in current if key not in self.docs]
+            for key in removed:
+                self._remove(key)
+            for key in added:
+                self._add(key, current[key])
+            if added or removed:
+                self.version += 1
+                self.cache.save()
+        return len(added), len(removed)
+
+    def refresh(self, path="jobs.json"):
+        """Re-read path only if it changed on disk since the last refresh"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return 0, 0
+        source_version = (st.st_mtime_ns, st.st_size)
+        with self.lock:
+            if source_version == self.source_version:
+                return 0, 0
+            self.source_version = source_version
+            return self.update(load_jobs(path))
+
+    def search(self, query="", min_similarity=0.0, limit=50):
+        """
+        Return [(similarity, matched skills, job)] for jobs containing every
+        query token, best skill match first.
+        """
+        terms = tokenize(normalize_text(query))
+        results = []
+        with self.lock:
+            if terms:
+                postings = sorted((self.postings.get(t, set()) for t in terms), key=len)
+                keys = set(postings[0]).intersection(*postings[1:])
+            else:
+                keys = self.docs.keys()
+
+            for key in keys:
+                similarity, matched = self.doc_scores[key]
+                if similarity >= min_similarity:
+                    results.append((similarity, matched, self.docs[key]))
+        results.sort(key=lambda r: r[0], reverse=True)
+        return results[:limit]
@@ -0,0 +1,195 @@
+"""
+Compact Job record shared by every pipeline stage.
+
+Jobs used to travel as loose dicts with inconsistent keys (``url`` vs
+``link``, ``email`` in config/job_list.json, ``tags`` only for RemoteOK).
+Job normalizes those on the way in, interns the low-cardinality strings and
+can defer loading the description until a stage actually reads it.
+"""
+import json
+import sys
+
+from html_text import html_to_text
+
+FIELDS = ("title", "company", "url", "location", "source", "published", "tags")
+
+
+class Job:
+    """Slotted job posting with dict-style read access for older callers"""
+
+    __slots__ = ("title", "company", "url", "location", "source", "published", "tags",
+                 "_description", "_text")
+
+    def __init__(self, title="", company="", url="", description="", location="Remote",
+                 source="", published="", tags=(), text=None):
+        self.title = title or ""
+        self.company = sys.intern(company or "")
+        self.url = url or ""
+        self.location = sys.intern(location or "")
+        self.source = sys.intern(source or "")
+        self.published = published or ""
+        self.tags = tuple(sys.intern(t) for t in tags if isinstance(t, str)) if tags else ()
+        # Either the description string or a zero-argument loader for it
+        self._description = description
+        # Plain-text rendering of the description, filled at ingest or on first use
+        self._text = text
+
+    @property
+    def description(self):
+        if callable(self._description):
+            self._description = self._description()
+        return self._description or ""
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._text = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = html_to_text(self.description)
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    # Mapping-style access so stages written against dicts keep working
+    def get(self, key, default=None):
+        if key in FIELDS or key in ("description", "text"):
+            value = getattr(self, key)
+            return list(value) if key == "tags" else value
+        if key == "link":
+            return self.url
+        return default
+
+    def __getitem__(self, key):
+        if key in FIELDS or key in ("description", "text", "link"):
+            return self.get(key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in FIELDS or key in ("description", "text", "link")
+
+    def __repr__(self):
+        return f"Job({self.title!r} @ {self.company!r})"
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Job from any of the historical dict layouts"""
+        url = data.get("url") or data.get("link") or ""
+        if not url and data.get("email"):
+            url = f"mailto:{data['email']}"
+        return cls(
+            title=data.get("title") or data.get("position") or "",
+            company=data.get("company", ""),
+            url=url,
+            description=data.get("description", ""),
+            location=data.get("location", "Remote"),
+            source=data.get("source", ""),
+            published=data.get("published", ""),
+            tags=data.get("tags") or (),
+            text=data.get("text"),
+        )
+
+    def to_dict(self):
+        """Serialize using the keys jobs.json has always used"""
+        data = {
+            "title": self.title,
+            "company": self.company,
+            "url": self.url,
+            "description": self.description,
+            "location": self.location,
+            "source": self.source,
+        }
+        if self._text is not None:
+            data["text"] = self._text
+        if self.published:
+            data["published"] = self.published
+        if self.tags:
+            data["tags"] = list(self.tags)
+        return data
+
+
+def load_jobs(path):
+    """Load a JSON array of jobs"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [Job.from_dict(item) for item in json.load(f) if isinstance(item, dict)]
+
+
+def save_jobs(path, jobs, indent=2):
+    """Write jobs as a JSON array"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([job.to_dict() for job in jobs], f, indent=indent)
+
+
+def _line_loader(path, offset):
+    def load():
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline()).get("description", "")
+    return load
+
+
+def read_jsonl(path, lazy_descriptions=False):
+    """Read one job per line; optionally defer descriptions until accessed"""
+    jobs = []
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                job = Job.from_dict(data)
+                if lazy_descriptions and job._description:
+                    job._description = _line_loader(path, offset)
+                jobs.append(job)
+            offset += len(line)
+    return jobs
+
+
+def write_jsonl(path, jobs):
+    """Write one compact JSON job per line"""
+    with open(path, "w", encoding="utf-8") as f:
+        for job in jobs:
+            f.write(json.dumps(job.to_dict(), separators=(",", ":")))
+            f.write("\n")
+
+
+def measure_memory(count=100000):
+    """Compare heap usage of dict jobs vs Job records at a given corpus size"""
+    import tracemalloc
+
+    def sample(i):
+        return {
+            "title": f"Senior Python Developer {i}",
+            "company": f"Company {i % 500}",
+            "url": f"https://remoteok.com/remote-jobs/{i}",
+            "description": "",
+            "location": "Remote",
+            "source": "RemoteOK",
+            "tags": ["python", "django", "remote"],
+        }
+
+    tracemalloc.start()
+    dicts = [sample(i) for i in range(count)]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del dicts
+
+    tracemalloc.start()
+    records = [Job.from_dict(sample(i)) for i in range(count)]
+    job_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+
+    return dict_bytes, job_bytes
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dict_bytes, job_bytes = measure_memory(n)
+    print(f"📏 {n} jobs (descriptions excluded)")
+    print(f"   dict: {dict_bytes / n:.0f} bytes/job ({dict_bytes / 1e6:.1f} MB)")
+    print(f"   Job:  {job_bytes / n:.0f} bytes/job ({job_bytes / 1e6:.1f} MB)")
+    print(f"   Saved {100 * (1 - job_bytes / dict_bytes):.0f}%")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Columnar, memory-mapped snapshot of a job store for analytics.
+
+A JSON job file is exported once into NumPy column files: dictionary-encoded
+source/company codes, a published-day column and CSR-style tag/skill lists,
+plus a UTF-8 title blob for printing samples (company names live in
+meta.json alongside the other dictionaries). Opening a snapshot
+memory-maps the columns, so counts, group-bys and frequency stats run
+vectorized without parsing JSON or building a dict per job.
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from feature_cache import FeatureCache
+from job_record import load_jobs
+from ranking import published_ts
+
+SNAPSHOT_ROOT = ".cache/snapshot"
+SNAPSHOT_VERSION = 1
+UNKNOWN_DAY = -1
+
+
+def snapshot_dir(source_path, root=SNAPSHOT_ROOT):
+    return os.path.join(root, os.path.splitext(os.path.basename(source_path))[0])
+
+
+class _Dictionary:
+    """Assign dense integer codes to strings in first-seen order"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _blob(strings):
+    """Pack strings into one UTF-8 byte column plus int64 offsets"""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _csr(lists, dictionary):
+    """Encode a list of string lists as (offsets, codes) arrays"""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum([len(values) for values in lists], out=offsets[1:])
+    codes = np.fromiter((dictionary.code(v) for values in lists for v in values),
+                        dtype=np.int32, count=int(offsets[-1]))
+    return offsets, codes
+
+
+def export_snapshot(source_path, out_dir=None, skills=None):
+    """Write a columnar snapshot of a JSON job store; returns the directory"""
+    out_dir = out_dir or snapshot_dir(source_path)
+    jobs = load_jobs(source_path)
+    if skills is None:
+        try:
+            with open("config/user_profile.json", "r", encoding="utf-8") as f:
+                skills = json.load(f).get("skills", [])
+        except (OSError, ValueError):
+            skills = []
+
+    cache = FeatureCache()
+    sources, companies, tags, skill_dict = _Dictionary(), _Dictionary(), _Dictionary(), _Dictionary()
+    columns = {
+        "source": np.fromiter((sources.code(j.source) for j in jobs), dtype=np.int32, count=len(jobs)),
+        "company": np.fromiter((companies.code(j.company) for j in jobs), dtype=np.int32, count=len(jobs)),
+        "day": np.fromiter(
+            (int(ts // 86400) if ts else UNKNOWN_DAY for ts in (published_ts(j.published) for j in jobs)),
+            dtype=np.int32, count=len(jobs)),
+    }
+    columns["tag_offsets"], columns["tag_codes"] = _csr([[t.lower() for t in j.tags] for j in jobs], tags)
+    columns["skill_offsets"], columns["skill_codes"] = _csr(
+        [cache.get(j, skills)["skills"] for j in jobs], skill_dict)
+    columns["title_bytes"], columns["title_offsets"] = _blob(j.title for j in jobs)
+    cache.save()
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, column in columns.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), column)
+
+    st = os.stat(source_path)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "count": len(jobs),
+        "source_file": {"mtime_ns": st.st_mtime_ns, "size": st.st_size},
+        "sources": sources.values,
+        "companies": companies.values,
+        "tags": tags.values,
+        "skills": skill_dict.values,
+    }
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, separators=(",", ":"))
+    return out_dir
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of an exported job snapshot"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {self.meta.get('version')} != {SNAPSHOT_VERSION}")
+        self.count = self.meta["count"]
+        self._columns = {}
+
+    def column(self, name):
+        if name not in self._columns:
+            self._columns[name] = np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode="r")
+        return self._columns[name]
+
+    def is_fresh(self, source_path):
+        try:
+            st = os.stat(source_path)
+        except OSError:
+            return False
+        recorded = self.meta.get("source_file", {})
+        return recorded.get("mtime_ns") == st.st_mtime_ns and recorded.get("size") == st.st_size
+
+    def title(self, i):
+        offsets = self.column("title_offsets")
+        return bytes(self.column("title_bytes")[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def company(self, i):
+        return self.meta["companies"][int(self.column("company")[i])]
+
+    def counts_by(self, name):
+        """Count jobs per dictionary value of a column (source or company)"""
+        values = self.meta["sources" if name == "source" else "companies"]
+        counts = np.bincount(self.column(name), minlength=len(values))
+        order = np.argsort(counts)[::-1]
+        return [(values[i], int(counts[i])) for i in order if counts[i]]
+
+    def per_source_per_day(self):
+        """Return {(source, 'YYYY-MM-DD' or 'unknown'): count}"""
+        source = np.asarray(self.column("source"), dtype=np.int64)
+        day = np.asarray(self.column("day"), dtype=np.int64)
+        keys, counts = np.unique(np.stack([source, day]), axis=1, return_counts=True)
+        result = {}
+        for (src, d), count in zip(keys.T, counts):
+            label = time.strftime("%Y-%m-%d", time.gmtime(int(d) * 86400)) if d != UNKNOWN_DAY else "unknown"
+            result[(self.meta["sources"][src], label)] = int(count)
+        return result
+
+    def top_terms(self, kind="tag", n=10, since_days=None):
+        """Most frequent tags or matched skills, optionally within the last N days"""
+        offsets = self.column(f"{kind}_offsets")
+        codes = self.column(f"{kind}_codes")
+        values = self.meta["tags" if kind == "tag" else "skills"]
+        if since_days is not None:
+            cutoff = int(time.time() // 86400) - since_days
+            keep = np.repeat(np.asarray(self.column("day")) >= cutoff, np.diff(offsets))
+            codes = np.asarray(codes)[keep]
+        counts = np.bincount(codes, minlength=len(values))
+        order = np.argsort(counts)[::-1][:n]
+        return [(values[i], int(counts[i])) for i in order if counts[i]]
+
+
+def open_snapshot(source_path, root=SNAPSHOT_ROOT):
+    """Open the snapshot for source_path, re-exporting it if the source changed"""
+    directory = snapshot_dir(source_path, root)
+    try:
+        snap = Snapshot(directory)
+        if snap.is_fresh(source_path):
+            return snap
+    except (OSError, ValueError, KeyError):
+        pass
+    export_snapshot(source_path, directory)
+    return Snapshot(directory)
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "jobs.json"
+    snap = open_snapshot(path)
+    print(f"📦 {path}: {snap.count} jobs (snapshot in {snap.directory})")
+    print("   Per source:", ", ".join(f"{s} {c}" for s, c in snap.counts_by("source")))
+    print("   Top tags:", ", ".join(f"{t} ({c})" for t, c in snap.top_terms("tag")))
+    print("   Top skills this week:", ", ".join(f"{t} ({c})" for t, c in snap.top_terms("skill", since_days=7)))
@@ -1,20 +1,98 @@
-import requests
+import hashlib
 import json
 import os
+import time
+from job_record import Job, load_jobs, save_jobs
+from ranking import MatchCriteria, rank_jobs
+from html_text import sanitize_jobs
+from rate_limiter import limited_get
 
-def get_job_matches(profile_path="config/user_profile.json", max_results=10):
-    """Get job matches from multiple sources"""
-    
-    # First try to use jobs from find_jobs.py
-    if os.path.exists("jobs.json"):
+JOBS_PATH = "jobs.json"
+
+# Every deduplicated, sanitized posting before profile filtering; jobs.json
+# only holds the ones that passed filtering for the default profile
+CORPUS_PATH = "corpus.json"
+
+# Refresh the local snapshot from the job sources once it is older than this
+SNAPSHOT_TTL_HOURS = float(os.environ.get("JOBS_TTL_HOURS", "24"))
+
+# (path, mtime_ns, size) -> jobs, and (profile hash, snapshot version, k) -> matches
+_snapshot_cache = {}
+_match_cache = {}
+
+# path -> time.time() of the last refresh attempt, successful or not
+_refresh_attempts = {}
+
+def profile_hash(profile):
+    """Stable hash of the profile fields that affect matching"""
+    criteria = MatchCriteria.from_profile(profile)
+    payload = json.dumps([criteria.skills, criteria.titles, criteria.location])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def snapshot_version(path=CORPUS_PATH):
+    """Identify the current on-disk snapshot, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+def refresh_snapshot(path=CORPUS_PATH):
+    """
+    Re-fetch the sources into the unfiltered corpus; rank_jobs does the
+    per-profile selection. Only real source results are saved; if every
+    source fails the existing snapshot is kept.
+    """
+    from find_jobs import collect_jobs
+
+    print("🔄 Job snapshot is stale, refreshing from sources...")
+    _refresh_attempts[path] = time.time()
+    _, unique_jobs = collect_jobs(fallback=False)
+    if not unique_jobs:
+        print(f"⚠️ No jobs from any source, keeping existing {path}")
+        return []
+    save_jobs(path, unique_jobs)
+    print(f"💾 Refreshed {path} with {len(unique_jobs)} jobs")
+    return unique_jobs
+
+def needs_refresh(path, version, ttl_hours=SNAPSHOT_TTL_HOURS):
+    """True once both the snapshot and the last refresh attempt are past the TTL"""
+    ttl = ttl_hours * 3600
+    now = time.time()
+    if version is not None and now - version[1] / 1e9 <= ttl:
+        return False
+    # A failed refresh leaves the file as it was; wait a full TTL before retrying
+    return now - _refresh_attempts.get(path, 0.0) > ttl
+
+def load_snapshot(path=CORPUS_PATH, ttl_hours=SNAPSHOT_TTL_HOURS):
+    """Return (jobs, version) for the local store, refreshing it past its TTL"""
+    version = snapshot_version(path)
+    if needs_refresh(path, version, ttl_hours):
         try:
-            with open("jobs.json", "r") as f:
-                existing_jobs = json.load(f)
-            if existing_jobs:
-                print(f"✅ Using {len(existing_jobs)} jobs from local jobs.json")
-                return existing_jobs[:max_results]
+            refresh_snapshot(path)
         except Exception as e:
-            print(f"⚠️ Could not load existing jobs.json: {e}")
+            print(f"⚠️ Could not refresh job snapshot: {e}")
+        version = snapshot_version(path)
+        if version is None:
+            return [], None
+
+    jobs = _snapshot_cache.get(version)
+    if jobs is None:
+        try:
+            jobs = load_jobs(path)
+        except Exception as e:
+            print(f"⚠️ Could not load existing {path}: {e}")
+            return [], None
+        # Only the current snapshot's jobs and matches are worth keeping
+        _snapshot_cache.clear()
+        _match_cache.clear()
+        _snapshot_cache[version] = jobs
+        print(f"✅ Loaded {len(jobs)} jobs from local {path}")
+    return jobs, version
+
+def get_job_matches(profile_path="config/user_profile.json", max_results=10,
+                    jobs_path=CORPUS_PATH, ttl_hours=SNAPSHOT_TTL_HOURS):
+    """Score the unfiltered local corpus against a profile, memoized per snapshot"""
     
     # Load user profile for filtering
     try:
@@ -24,18 +102,27 @@ def get_job_matches(profile_path="config/user_profile.json", max_results=10):
         print(f"❌ Could not load profile from {profile_path}: {e}")
         return []
 
+    jobs, version = load_snapshot(jobs_path, ttl_hours)
+
+    key = (profile_hash(profile), version, max_results)
+    if version is not None and key in _match_cache:
+        return _match_cache[key]
+
     # Extract search criteria from profile
-    user_skills = [s.lower().strip() for s in profile.get("skills", [])]
-    job_prefs = profile.get("job_preferences", {})
-    preferred_titles = [t.lower().strip() for t in job_prefs.get("preferred_titles", [])]
-    location = profile.get("location", "").lower().strip()
+    criteria = MatchCriteria.from_profile(profile)
     
-    print(f"🔍 Searching for jobs matching skills: {user_skills}")
-    print(f"🎯 Preferred titles: {preferred_titles}")
+    print(f"🔍 Searching for jobs matching skills: {criteria.skills}")
+    print(f"🎯 Preferred titles: {criteria.titles}")
 
-    # Fetch from RemoteOK API as backup
-    matches = fetch_from_remoteok(user_skills, preferred_titles, location, max_results)
-    
+    if jobs:
+        matches = rank_jobs(jobs, criteria, max_results)
+        print(f"✅ Found {len(matches)} relevant matches")
+    else:
+        # Fetch from RemoteOK API as backup
+        matches = fetch_from_remoteok(criteria.skills, criteria.titles, criteria.location, max_results)
+
+    if version is not None:
+        _match_cache[key] = matches
     return matches
 
 def fetch_from_remoteok(user_skills, preferred_titles, location, max_results):
@@ -45,7 +132,7 @@ def fetch_from_remoteok(user_skills, preferred_titles, location, max_results):
 
     try:
         print("🌐 Fetching from RemoteOK API...")
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = limited_get(url, headers=headers, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -57,71 +144,32 @@ def fetch_from_remoteok(user_skills, preferred_titles, location, max_results):
 
         print(f"📥 Fetched {len(jobs_data)} jobs from RemoteOK")
 
-        matches = []
-        for job in jobs_data:
-            if not isinstance(job, dict):
+        jobs = []
+        for raw in jobs_data:
+            if not isinstance(raw, dict):
                 continue
 
-            title = job.get("position", "").lower()
-            company = job.get("company", "")
-            tags = [t.lower() for t in job.get("tags", []) if isinstance(t, str)]
-            job_location = job.get("location", "").lower()
-            description = job.get("description", "").lower()
-
-            # Scoring system for better matches
-            score = 0
-            
-            # Check for preferred title matches (highest priority)
-            title_match = any(pref_title in title for pref_title in preferred_titles)
-            if title_match:
-                score += 10
-            
-            # Check for skill matches in title (high priority)
-            title_skill_match = any(skill in title for skill in user_skills)
-            if title_skill_match:
-                score += 8
-            
-            # Check for skill matches in tags (medium priority)
-            tag_skill_match = any(skill in tags for skill in user_skills)
-            if tag_skill_match:
-                score += 5
-            
-            # Check for skill matches in description (low priority)
-            desc_skill_match = any(skill in description for skill in user_skills)
-            if desc_skill_match:
-                score += 2
-            
-            # Location preference (if specified)
-            if location and location in job_location:
-                score += 3
-            elif not location:  # No location preference
-                score += 1
-
-            # Only include jobs with some relevance
-            if score > 0:
-                job_url = job.get("url", "")
-                if not job_url and job.get("id"):
-                    job_url = f"https://remoteok.com/remote-jobs/{job.get('id')}"
-                
-                matches.append({
-                    "title": job.get("position", "").strip(),
-                    "company": company.strip(),
-                    "url": job_url,
-                    "description": job.get("description", ""),
-                    "location": job.get("location", "Remote"),
-                    "tags": job.get("tags", []),
-                    "score": score,
-                    "source": "RemoteOK"
-                })
-
-        # Sort by relevance score (highest first)
-        matches.sort(key=lambda x: x.get("score", 0), reverse=True)
-        
-        # Remove score from final output and limit results
-        final_matches = []
-        for match in matches[:max_results]:
-            match.pop("score", None)  # Remove score field
-            final_matches.append(match)
+            job_url = raw.get("url", "")
+            if not job_url and raw.get("id"):
+                job_url = f"https://remoteok.com/remote-jobs/{raw.get('id')}"
+
+            jobs.append(Job(
+                title=raw.get("position", "").strip(),
+                company=raw.get("company", "").strip(),
+                url=job_url,
+                description=raw.get("description", ""),
+                location=raw.get("location", "Remote"),
+                published=raw.get("date", ""),
+                tags=raw.get("tags", []),
+                source="RemoteOK"
+            ))
+
+        # Convert HTML descriptions to plain text once, at ingest
+        sanitize_jobs(jobs)
+
+        # Keep only the top max_results in a bounded heap, with scores and reasons
+        criteria = MatchCriteria(user_skills, preferred_titles, location)
+        final_matches = rank_jobs(jobs, criteria, max_results)
         
         print(f"✅ Found {len(final_matches)} relevant matches")
         return final_matches
@@ -133,8 +181,7 @@ def fetch_from_remoteok(user_skills, preferred_titles, location, max_results):
 def save_matches_to_file(matches, filename="matched_jobs.json"):
     """Save matched jobs to a file"""
     try:
-        with open(filename, "w") as f:
-            json.dump(matches, f, indent=2)
+        save_jobs(filename, matches)
         print(f"💾 Saved {len(matches)} matches to {filename}")
     except Exception as e:
         print(f"❌ Failed to save matches: {e}")
@@ -149,8 +196,10 @@ if __name__ == "__main__":
         save_matches_to_file(jobs)
         print(f"\nTop matches:")
         for idx, job in enumerate(jobs[:5], 1):
-            print(f" {idx}. {job['title']} @ {job['company']}")
+            print(f" {idx}. {job['title']} @ {job['company']} (score {job.get('score', 0)})")
             print(f"    📍 {job.get('location', 'Remote')}")
+            if job.get('reasons'):
+                print(f"    💡 {'; '.join(job['reasons'])}")
             print(f"    🔗 {job['url']}")
             if job.get('tags'):
                 print(f"    🏷️  Tags: {', '.join(job['tags'][:5])}")
@@ -159,49 +208,3 @@ if __name__ == "__main__":
         print(" ❌ No jobs matched your profile.")
     
     input("Press Enter to exit...")
-
-    except Exception as e:
-        print("❌ Failed to fetch jobs:", e)
-        return []
-
-    # — Filter by title keywords OR skills, plus location —
-    matches = []
-    for job in data:
-        if not isinstance(job, dict):
-            continue
-
-        title = job.get("position", "").lower()
-        tags  = [t.lower() for t in job.get("tags", [])]
-        loc   = job.get("location", "").lower()
-
-        title_match = any(kw in title for kw in keywords)
-        tag_match   = any(kw in tags for kw in keywords)
-        skill_match = any(s in title or s in tags for s in skills)
-        loc_match   = not location or (location in loc)
-
-        if loc_match and (title_match or tag_match or skill_match):
-            matches.append({
-                "title":   job.get("position", "").strip(),
-                "company": job.get("company",  "").strip(),
-                "url":     job.get("url",      "").strip()
-            })
-
-        if len(matches) >= max_results:
-            break
-
-    return matches
-
-# ——— MAIN — allows direct execution and pauses for you to read ——————
-if __name__ == "__main__":
-    jobs = get_job_matches()
-    print("\n🔍 Jobs returned by get_job_matches():")
-    if jobs:
-        for idx, job in enumerate(jobs, 1):
-            print(f" {idx}. {job['title']} @ {job['company']}")
-            print(f"     → {job['url']}\n")
-    else:
-        print(" (No jobs matched your profile.)")
-    input("Press Enter to exit…")
-
-
-
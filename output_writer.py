@@ -0,0 +1,134 @@
+"""
+Parallel, digest-cached writer for generated per-job output files.
+
+Filenames are built from sanitized, length-limited parts; each file is
+written atomically (temp file + rename) by a thread pool, and files whose
+content digest matches the previous run are left untouched. Large runs can
+instead pack everything into a single zip bundle.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_NAME_LENGTH = 120
+MANIFEST_NAME = ".digests.json"
+
+UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+DOTS_RE = re.compile(r"\.{2,}")
+
+# Read once at import: os.umask() can only be queried by setting it, which
+# is not safe once writer threads are running
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def safe_filename(*parts, suffix="", max_length=MAX_NAME_LENGTH):
+    """Join parts into a portable filename, truncating with a hash if too long"""
+    cleaned = []
+    for part in parts:
+        text = unicodedata.normalize("NFKD", str(part)).encode("ascii", "ignore").decode("ascii")
+        text = DOTS_RE.sub(".", UNSAFE_RE.sub("_", text)).strip("._-")
+        if text:
+            cleaned.append(text)
+    stem = "_".join(cleaned) or "untitled"
+    limit = max_length - len(suffix) - (1 if suffix else 0)
+    if len(stem) > limit:
+        # Keep names unique after truncation
+        digest = hashlib.sha1(stem.encode("utf-8")).hexdigest()[:8]
+        stem = stem[:limit - 9].rstrip("._-") + "_" + digest
+    return f"{stem}_{suffix}" if suffix else stem
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file in the same directory and rename"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates 0600; keep the target's mode, else use what open() would give
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class OutputWriter:
+    """
+    Collect (filename, content) pairs for one output directory.
+    With bundle=None files are written concurrently and unchanged ones
+    skipped; with bundle='path.zip' everything is packed into that archive.
+    """
+
+    def __init__(self, directory, workers=8, bundle=None):
+        self.directory = directory
+        self.bundle = bundle
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.lock = threading.Lock()
+        self.written = 0
+        self.unchanged = 0
+        self.pending = []
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+        self.pool = None if bundle else ThreadPoolExecutor(max_workers=workers)
+
+    def _write(self, name, data, digest):
+        path = os.path.join(self.directory, name)
+        if self.manifest.get(name) == digest and os.path.exists(path):
+            with self.lock:
+                self.unchanged += 1
+            return
+        write_atomic(path, data)
+        with self.lock:
+            self.manifest[name] = digest
+            self.written += 1
+
+    def add(self, name, content):
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        if self.bundle:
+            self.pending.append((name, data))
+            return os.path.join(self.bundle, name)
+        digest = hashlib.sha256(data).hexdigest()
+        self.pending.append(self.pool.submit(self._write, name, data, digest))
+        return os.path.join(self.directory, name)
+
+    def close(self):
+        """Finish all writes and return (written, unchanged)"""
+        if self.bundle:
+            tmp_path = self.bundle + ".tmp"
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for name, data in self.pending:
+                    zf.writestr(name, data)
+            os.replace(tmp_path, self.bundle)
+            self.written = len(self.pending)
+        else:
+            self.pool.shutdown(wait=True)
+            for future in self.pending:
+                future.result()
+            write_atomic(self.manifest_path, json.dumps(self.manifest, indent=1).encode("utf-8"))
+        self.pending = []
+        return self.written, self.unchanged
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,21 +1,22 @@
-import json
 from scam_filter import is_scam
+from feature_cache import FeatureCache
+from job_record import load_jobs, save_jobs
 
 # Load jobs from JSON file
-with open("jobs.json") as f:
-    jobs = json.load(f)
+jobs = load_jobs("jobs.json")
 
 safe_jobs = []
+cache = FeatureCache()
 
 for job in jobs:
-    description = job.get("description", "")
-    link = job.get("link", "")
-    if is_scam(description, link):
-        print(f"❌ Skipping suspicious job: {job.get('title')}")
+    features = cache.get(job)
+    if is_scam(job.description, job.url, score=features["scam"]):
+        print(f"❌ Skipping suspicious job: {job.title}")
     else:
-        print(f"✅ Passing safe job: {job.get('title')}")
+        print(f"✅ Passing safe job: {job.title}")
         safe_jobs.append(job)
 
+cache.save()
+
 # Save filtered jobs to new file
-with open("safe_jobs.json", "w") as f:
-    json.dump(safe_jobs, f, indent=2)
+save_jobs("safe_jobs.json", safe_jobs)
@@ -0,0 +1,187 @@
+"""
+Top-k job ranking.
+
+Jobs stream through a bounded min-heap of size k, so ranking n postings
+costs O(n log k) instead of sorting every match. The cheap signals (title,
+tags, location) are scored first; when even a description hit could not
+lift a job into the current top k, the description scan is skipped.
+"""
+import heapq
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+from feature_cache import FeatureCache
+
+TITLE_WEIGHT = 10
+TITLE_SKILL_WEIGHT = 8
+TAG_SKILL_WEIGHT = 5
+DESC_SKILL_WEIGHT = 2
+LOCATION_WEIGHT = 3
+ANY_LOCATION_WEIGHT = 1
+
+
+class MatchCriteria:
+    """Lowercased matching inputs extracted from a user profile"""
+
+    __slots__ = ("skills", "titles", "location")
+
+    def __init__(self, skills=(), titles=(), location=""):
+        self.skills = [s.lower().strip() for s in skills]
+        self.titles = [t.lower().strip() for t in titles]
+        self.location = (location or "").lower().strip()
+
+    @classmethod
+    def from_profile(cls, profile):
+        return cls(
+            skills=profile.get("skills", []),
+            titles=profile.get("job_preferences", {}).get("preferred_titles", []),
+            location=profile.get("location", ""),
+        )
+
+
+class Match:
+    """A ranked job together with its score and the reasons behind it"""
+
+    __slots__ = ("job", "score", "reasons")
+
+    def __init__(self, job, score, reasons):
+        self.job = job
+        self.score = score
+        self.reasons = reasons
+
+    def __getattr__(self, name):
+        # Unset slots (mid copy/unpickle) and dunder lookups must not recurse
+        if name == "job" or name.startswith("__"):
+            raise AttributeError(name)
+        # Read-through to the underlying Job (title, company, url, ...)
+        return getattr(self.job, name)
+
+    def get(self, key, default=None):
+        if key in ("score", "reasons"):
+            return getattr(self, key)
+        return self.job.get(key, default)
+
+    def __getitem__(self, key):
+        if key in ("score", "reasons"):
+            return getattr(self, key)
+        return self.job[key]
+
+    def __repr__(self):
+        return f"Match({self.job!r}, score={self.score})"
+
+    def to_dict(self):
+        data = self.job.to_dict()
+        data["score"] = self.score
+        data["reasons"] = list(self.reasons)
+        return data
+
+
+def published_ts(value):
+    """Parse an ISO-8601 or RFC 822 'published' value to a POSIX timestamp"""
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return 0.0
+
+
+def score_cheap(job, criteria):
+    """Score the signals that do not need the description"""
+    title = job.title.lower()
+    tags = [t.lower() for t in job.tags]
+    score = 0
+    reasons = []
+
+    for pref_title in criteria.titles:
+        if pref_title in title:
+            score += TITLE_WEIGHT
+            reasons.append(f"title matches '{pref_title}'")
+            break
+
+    for skill in criteria.skills:
+        if skill in title:
+            score += TITLE_SKILL_WEIGHT
+            reasons.append(f"skill '{skill}' in title")
+            break
+
+    for skill in criteria.skills:
+        if skill in tags:
+            score += TAG_SKILL_WEIGHT
+            reasons.append(f"tagged '{skill}'")
+            break
+
+    if criteria.location and criteria.location in job.location.lower():
+        score += LOCATION_WEIGHT
+        reasons.append(f"location matches '{criteria.location}'")
+    elif not criteria.location:
+        score += ANY_LOCATION_WEIGHT
+        reasons.append("no location preference")
+
+    return score, reasons
+
+
+def iter_scored(jobs, criteria, cache, floor=None, stats=None):
+    """
+    Yield (key, Match) for every relevant job. ``floor`` is a callable
+    returning the current worst key worth keeping; jobs whose upper bound
+    falls at or below it are skipped before their description is scanned.
+    """
+    for seq, job in enumerate(jobs):
+        score, reasons = score_cheap(job, criteria)
+        recency = published_ts(job.published)
+
+        if floor is not None:
+            bound = floor()
+            if bound is not None and (score + DESC_SKILL_WEIGHT, recency, -seq) <= bound:
+                if stats is not None:
+                    stats["skipped"] = stats.get("skipped", 0) + 1
+                continue
+
+        desc_skills = cache.get(job, criteria.skills)["skills"]
+        if desc_skills:
+            score += DESC_SKILL_WEIGHT
+            reasons.append(f"description mentions {', '.join(desc_skills[:5])}")
+
+        # Only include jobs with some relevance
+        if score > 0:
+            yield (score, recency, -seq), Match(job, score, reasons)
+
+
+def top_k(scored, k, heap=None):
+    """Keep the k best (key, Match) pairs from a stream, best first"""
+    heap = [] if heap is None else heap
+    for key, match in scored:
+        if len(heap) < k:
+            heapq.heappush(heap, (key, match))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, match))
+    return [match for _, match in sorted(heap, key=lambda entry: entry[0], reverse=True)]
+
+
+def rank_jobs(jobs, criteria, k, cache=None):
+    """Return the k best matches, ties broken by most recently published"""
+    if k <= 0:
+        return []
+    own_cache = cache is None
+    if own_cache:
+        cache = FeatureCache()
+
+    # The heap is shared with the scorer so it can exit early on hopeless jobs
+    heap = []
+    stats = {}
+
+    def floor():
+        return heap[0][0] if len(heap) >= k else None
+
+    ranked = top_k(iter_scored(jobs, criteria, cache, floor, stats), k, heap)
+    if stats.get("skipped"):
+        print(f"⚡ Skipped description scan for {stats['skipped']} jobs that could not reach the top {k}")
+
+    if own_cache:
+        cache.save()
+    return ranked
@@ -0,0 +1,153 @@
+"""
+Shared per-domain rate limiting and circuit breaking for outbound traffic.
+
+Every domain gets a token bucket whose refill rate adapts AIMD-style: it
+creeps up additively while the host answers quickly and is halved on 429,
+5xx, connection errors or slow responses. After several consecutive
+failures the domain's circuit opens and requests fail fast until a
+cooldown has passed; one probe request then decides whether it closes.
+A probe that never reports back within PROBE_TIMEOUT counts as failed.
+
+Scrapers call limited_get(); the browser path brackets driver.get() with
+acquire()/record().
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+START_RATE = 1.0        # requests per second for a domain we have not seen
+MIN_RATE = 0.05
+MAX_RATE = 5.0
+BURST = 2.0
+ADDITIVE_STEP = 0.1
+DECREASE_FACTOR = 0.5
+SLOW_RESPONSE = 5.0     # seconds; slower than this counts as back-pressure
+FAILURE_THRESHOLD = 5
+COOLDOWN = 300.0
+PROBE_TIMEOUT = 120.0   # seconds a half-open probe may take to call record()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a domain that keeps failing"""
+
+
+def domain_of(url):
+    return urlsplit(url).hostname or url
+
+
+class DomainState:
+    __slots__ = ("rate", "tokens", "updated", "not_before", "failures", "open_until",
+                 "probing", "probe_started")
+
+    def __init__(self):
+        self.rate = START_RATE
+        self.tokens = BURST
+        self.updated = time.monotonic()
+        self.not_before = 0.0
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.probe_started = 0.0
+
+
+class DomainLimiter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.domains = {}
+
+    def _state(self, domain):
+        state = self.domains.get(domain)
+        if state is None:
+            state = self.domains[domain] = DomainState()
+        return state
+
+    def acquire(self, url):
+        """Block until a request to url's domain is allowed"""
+        domain = domain_of(url)
+        while True:
+            with self.lock:
+                state = self._state(domain)
+                now = time.monotonic()
+                if state.open_until:
+                    if now < state.open_until:
+                        raise CircuitOpenError(f"{domain} circuit open for {state.open_until - now:.0f}s more")
+                    if state.probing:
+                        if now - state.probe_started < PROBE_TIMEOUT:
+                            raise CircuitOpenError(f"{domain} circuit half-open, waiting on probe request")
+                        # The probe's caller never called record(): treat it as failed
+                        state.probing = False
+                        state.open_until = now + COOLDOWN
+                        raise CircuitOpenError(f"{domain} probe request timed out, pausing for {COOLDOWN:.0f}s")
+                    # Cooldown over: let a single probe through (half-open)
+                    state.probing = True
+                    state.probe_started = now
+                    return
+
+                state.tokens = min(BURST, state.tokens + (now - state.updated) * state.rate)
+                state.updated = now
+                wait = state.not_before - now
+                if wait <= 0 and state.tokens >= 1:
+                    state.tokens -= 1
+                    return
+                wait = max(wait, (1 - state.tokens) / state.rate)
+            time.sleep(wait)
+
+    def record(self, url, status=None, latency=0.0, error=False, retry_after=None):
+        """Feed a request outcome back into the domain's rate and circuit"""
+        domain = domain_of(url)
+        with self.lock:
+            state = self._state(domain)
+            now = time.monotonic()
+            failed = error or status == 429 or (status is not None and status >= 500)
+
+            if failed or latency > SLOW_RESPONSE:
+                state.rate = max(MIN_RATE, state.rate * DECREASE_FACTOR)
+            else:
+                state.rate = min(MAX_RATE, state.rate + ADDITIVE_STEP)
+
+            if retry_after:
+                state.not_before = max(state.not_before, now + retry_after)
+
+            if failed:
+                state.failures += 1
+                if state.probing or state.failures >= FAILURE_THRESHOLD:
+                    state.open_until = now + COOLDOWN
+                    print(f"🚧 {domain}: {state.failures} consecutive failures, pausing for {COOLDOWN:.0f}s")
+            else:
+                state.failures = 0
+                state.open_until = 0.0
+            state.probing = False
+
+
+_limiter = DomainLimiter()
+
+
+def get_limiter():
+    """Process-wide limiter shared by the scrapers and the browser path"""
+    return _limiter
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def limited_get(url, limiter=None, **kwargs):
+    """requests.get() that waits for the domain's limiter and reports back"""
+    import requests
+
+    limiter = limiter or _limiter
+    limiter.acquire(url)
+    start = time.monotonic()
+    try:
+        response = requests.get(url, **kwargs)
+    except BaseException:
+        # Always report back, or a half-open probe would stay pending
+        limiter.record(url, latency=time.monotonic() - start, error=True)
+        raise
+    limiter.record(url, response.status_code, time.monotonic() - start,
+                   retry_after=_retry_after(response))
+    return response
@@ -10,20 +10,25 @@ SCAM_KEYWORDS = [
 # List of sketchy domain extensions or patterns
 SUSPECT_DOMAINS = [".xyz", ".top", ".click", ".gq", ".tk", ".ml"]
 
-def is_scam(job_description, company_url=None):
-    text = job_description.lower()
+# Shady redirect links
+SHORTENER_RE = re.compile(r"(bit\.ly|tinyurl\.com|rb\.gy|rebrand\.ly|shorturl\.at)")
 
-    for keyword in SCAM_KEYWORDS:
-        if keyword in text:
-            return True
+def scam_score(text, markup=""):
+    """
+    Count red flags in already-lowercased description text. Shortener links
+    are also looked for in markup (the raw HTML), since href/src attributes
+    do not survive conversion to plain text.
+    """
+    score = sum(1 for keyword in SCAM_KEYWORDS if keyword in text)
+    if SHORTENER_RE.search(text) or (markup and SHORTENER_RE.search(markup.lower())):
+        score += 1
+    return score
 
-    if company_url:
-        for ext in SUSPECT_DOMAINS:
-            if company_url.endswith(ext):
-                return True
+def is_suspect_url(company_url):
+    return bool(company_url) and company_url.endswith(tuple(SUSPECT_DOMAINS))
 
-    # Check for shady redirect links
-    if re.search(r"(bit\.ly|tinyurl\.com|rb\.gy|rebrand\.ly|shorturl\.at)", text):
-        return True
-
-    return False
+def is_scam(job_description, company_url=None, score=None):
+    # A precomputed score (e.g. from the feature cache) skips the text scan
+    if score is None:
+        score = scam_score(job_description.lower())
+    return score > 0 or is_suspect_url(company_url)
@@ -1,56 +1,60 @@
-import json
 import os
-import csv
-import smtplib
-from email.mime.text import MIMEText
-from match_jobs import get_job_matches
-from datetime import datetime, timezone
-
-# ——— Brevo SMTP Credentials ———————————————————————————
-SENDER = "autoapplyai22@gmail.com"
-PASSWORD = "kVG0Sq4FbRXYgZtN"
-RECEIVER = SENDER  # Change if needed
-
-print("📨 Sending via Brevo as:", SENDER)
-
-# ——— Fetch job matches ————————————————————————————————
-jobs = get_job_matches("config/user_profile.json", max_results=3)
-
-# ——— Build email body ————————————————————————————————
-if jobs:
-    lines = ["Your Daily AutoapplyAI Job Suggestions", ""]
-    for job in jobs:
-        lines.append(f"• {job['title']} @ {job['company']}")
-        lines.append(f"    → {job['url']}")
-        lines.append("")
-    body_text = "\n".join(lines)
-else:
-    body_text = "No matches found today. Check your profile or try again later."
-
-# ——— Log suggestions to CSV ————————————————————————————
-log_path = "sent_jobs_log.csv"
-new_file = not os.path.exists(log_path)
-
-with open(log_path, "a", newline="", encoding="utf-8") as csvf:
-    writer = csv.writer(csvf)
-    if new_file:
-        writer.writerow(["timestamp", "title", "company", "url"])
-    ts = datetime.now(timezone.utc).isoformat()
-    for job in jobs:
-        writer.writerow([ts, job["title"], job["company"], job["url"]])
-
-# ——— Compose and send email using Brevo SMTP ——————————————
-msg = MIMEText(body_text)
-msg["From"] = SENDER
-msg["To"] = RECEIVER
-msg["Subject"] = "AutoapplyAI Daily Jobs"
-
-try:
-    with smtplib.SMTP("smtp-relay.brevo.com", 587) as server:
-        server.starttls()
-        server.login(SENDER, PASSWORD)
-        server.send_message(msg)
-    print("✅ Sent via Brevo successfully!")
-except Exception as e:
-    print("❌ Failed to send with Brevo:", e)
-
+from batch_match import PROFILES_DIR, load_profiles, match_profiles
+from digest_mailer import SMTPConfig, render_digests, send_digests
+from match_jobs import CORPUS_PATH, get_job_matches, load_snapshot
+from sent_history import SentHistory
+
+PROFILE_PATH = "config/user_profile.json"
+MAX_RESULTS = 3
+
+# Rank this many candidates so there are enough left after dropping ones already sent
+CANDIDATE_POOL = 50
+
+def collect_matches(receiver):
+    """Return ({name: matches}, {name: email}) for every configured applicant"""
+    # Many applicants: one pass over the unfiltered corpus for all of them
+    if os.path.isdir(PROFILES_DIR):
+        profiles = load_profiles(PROFILES_DIR)
+        jobs, _ = load_snapshot(CORPUS_PATH)
+        results = match_profiles(profiles, jobs, CANDIDATE_POOL)
+        recipients = {name: profile.get("email") for name, profile in profiles.items()}
+        return results, recipients
+
+    jobs = get_job_matches(PROFILE_PATH, max_results=CANDIDATE_POOL)
+    return {"default": jobs}, {"default": receiver}
+
+def keep_new(results, recipients, history):
+    """Trim each ranked list to the best MAX_RESULTS jobs not sent before"""
+    return {
+        name: history.filter_new(recipients.get(name) or "", matches, MAX_RESULTS)
+        for name, matches in results.items()
+    }
+
+def main():
+    # ——— SMTP credentials come from the environment (SMTP_USER / SMTP_PASS) ———
+    config = SMTPConfig.from_env()
+    if not config.sender:
+        print("❌ SMTP_USER (or SMTP_FROM) must be set to send suggestions")
+        return
+    receiver = os.environ.get("DIGEST_TO", config.sender)
+
+    print(f"📨 Sending via {config.host} as: {config.sender}")
+
+    # ——— Fetch job matches, dropping ones already suggested ———————
+    results, recipients = collect_matches(receiver)
+    with SentHistory() as history:
+        results = keep_new(results, recipients, history)
+
+        # ——— Render every digest, then send over pooled connections ———
+        messages = render_digests(results, recipients, config.sender)
+        sent, _ = send_digests(messages, config)
+
+        # ——— Record what was actually delivered ——————————————————
+        delivered = {msg["To"] for msg in sent}
+        for name, jobs in results.items():
+            if recipients.get(name) in delivered:
+                history.record(recipients[name], jobs)
+        history.prune()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Indexed history of job suggestions already sent to each recipient.
+
+Replaces the append-only sent_jobs_log.csv with a SQLite table keyed by
+(recipient, job), so "already suggested?" is a primary-key lookup and
+per-day aggregates use an index instead of scanning the whole log.
+"""
+import csv
+import hashlib
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+HISTORY_PATH = "sent_history.db"
+LEGACY_CSV = "sent_jobs_log.csv"
+RETENTION_DAYS = 180
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sent (
+    recipient TEXT NOT NULL,
+    job_key   TEXT NOT NULL,
+    day       TEXT NOT NULL,
+    ts        TEXT NOT NULL,
+    title     TEXT,
+    company   TEXT,
+    url       TEXT,
+    PRIMARY KEY (recipient, job_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sent_day ON sent (day);
+"""
+
+
+def job_id(job):
+    """Identify a posting by URL, falling back to title and company"""
+    ident = job.url or f"{job.title}\x1f{job.company}"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:20]
+
+
+class SentHistory:
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        is_new = path == ":memory:" or not os.path.exists(path)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        if is_new and os.path.exists(LEGACY_CSV) and path != ":memory:":
+            self.import_csv(LEGACY_CSV)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def already_sent(self, recipient, job):
+        row = self.db.execute(
+            "SELECT 1 FROM sent WHERE recipient = ? AND job_key = ?",
+            (recipient, job_id(job)),
+        ).fetchone()
+        return row is not None
+
+    def filter_new(self, recipient, jobs, limit=None):
+        """Keep jobs not yet suggested to recipient, in order, up to limit"""
+        fresh = []
+        for job in jobs:
+            if limit is not None and len(fresh) >= limit:
+                break
+            if not self.already_sent(recipient, job):
+                fresh.append(job)
+        return fresh
+
+    def record(self, recipient, jobs, when=None):
+        when = when or datetime.now(timezone.utc)
+        ts = when.isoformat()
+        day = when.date().isoformat()
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO sent VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(recipient, job_id(job), day, ts, job.title, job.company, job.url) for job in jobs],
+            )
+
+    def daily_counts(self, since_days=30):
+        """Return [(day, suggestions, recipients)] for recent days, newest first"""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=since_days)).date().isoformat()
+        return self.db.execute(
+            "SELECT day, COUNT(*), COUNT(DISTINCT recipient) FROM sent "
+            "WHERE day >= ? GROUP BY day ORDER BY day DESC",
+            (cutoff,),
+        ).fetchall()
+
+    def prune(self, retention_days=RETENTION_DAYS):
+        """Drop entries older than the retention window and reclaim space"""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).date().isoformat()
+        with self.db:
+            removed = self.db.execute("DELETE FROM sent WHERE day < ?", (cutoff,)).rowcount
+        if removed:
+            self.db.execute("VACUUM")
+            print(f"🧹 Pruned {removed} suggestions older than {retention_days} days")
+        return removed
+
+    def import_csv(self, csv_path, recipient=None):
+        """One-off import of the legacy sent_jobs_log.csv"""
+        from job_record import Job
+
+        recipient = recipient or os.environ.get("DIGEST_TO") or os.environ.get("SMTP_USER", "")
+        rows = []
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                job = Job(title=row.get("title", ""), company=row.get("company", ""), url=row.get("url", ""))
+                ts = row.get("timestamp", "")
+                rows.append((recipient, job_id(job), ts[:10], ts, job.title, job.company, job.url))
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO sent VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        print(f"📥 Imported {len(rows)} rows from {csv_path}")
+
+
+if __name__ == "__main__":
+    with SentHistory() as history:
+        print("📊 Suggestions per day (last 30 days):")
+        for day, count, recipients in history.daily_counts():
+            print(f"   {day}: {count} jobs to {recipients} recipient(s)")